@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import STORAGE_DIR
-from homeassistant.loader import async_get_integration
+from homeassistant.helpers.storage import Store
+from homeassistant.loader import IntegrationNotFound, async_get_integration
 
 from .const import (
     DOMAIN,
     STORAGE_KEY,
+    STORAGE_VERSION,
     DEFAULT_AIR_SPEED_STILL,
     CONF_HVAC_AIR_SPEED,
     CONF_DOOR_STATE_SENSOR,
@@ -44,91 +45,99 @@ PLATFORMS: list[Platform] = [
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keys introduced in config entry version 2, applied to V1 entries
+_V1_TO_V2_DEFAULTS = {
+    CONF_CLIMATE_ENTITY: None,
+    CONF_FAN_ENTITY: None,
+    CONF_WINDOW_STATE_SENSOR: None,
+    CONF_DOOR_STATE_SENSOR: None,
+    CONF_SHADING_ENTITY: None,
+    CONF_HVAC_AIR_SPEED: DEFAULT_AIR_SPEED_HVAC,
+    CONF_MANUAL_AIR_SPEED: DEFAULT_AIR_SPEED_STILL,
+    CONF_RADIANT_TYPE: "low_mass",
+    CONF_RADIANT_SURFACE_TEMP: None,
+}
+
+# Keys introduced in config entry version 4 (old entries are always Rooms on the main floor)
+_V3_TO_V4_DEFAULTS = {
+    CONF_DEVICE_TYPE: TYPE_ROOM,
+    CONF_FLOOR_LEVEL: 1,
+    CONF_CALIBRATION_RH_SENSOR: None,
+    CONF_PRECIPITATION_SENSOR: None,
+    CONF_UV_INDEX_SENSOR: None,
+}
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Virtual MRT from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Ensure all component domains are loaded before setting up platforms
-    for platform_domain in PLATFORMS:
-        try:
-            await async_get_integration(hass, platform_domain)
-        except ImportError:
+    # Ensure all component domains are loaded before setting up platforms.
+    # The lookups are independent, so resolve them concurrently.
+    results = await asyncio.gather(
+        *(async_get_integration(hass, platform) for platform in PLATFORMS),
+        return_exceptions=True,
+    )
+    for platform_domain, result in zip(PLATFORMS, results):
+        if isinstance(result, (ImportError, IntegrationNotFound)):
             _LOGGER.error(
                 "Failed to pre-load integration %s, setup cannot continue",
                 platform_domain,
             )
             return False
+        if isinstance(result, BaseException):
+            raise result
+
+    # One profile store per entry, shared by the select and button platforms so a
+    # pending delayed write is visible to every reader.
+    hass.data[DOMAIN][entry.entry_id] = Store(
+        hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}"
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # --- Register update listener with async_on_unload ---
-    # entry.add_update_listener returns a callable that removes the listener.
-    # entry.async_on_unload registers that callable to run when the entry unloads.
+    # add_update_listener returns the remover; async_on_unload runs it on unload,
+    # so reloads never accumulate listeners.
     entry.async_on_unload(entry.add_update_listener(async_update_listener))
-    # -------------------------------------------------------------
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    # --- CHANGED: Removed invalid 'remove_update_listener' call ---
-    # The listener is now automatically removed by async_on_unload above.
-
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    # The update listener is removed by async_on_unload, nothing to do here.
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+    return unload_ok
 
 
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old entry to a new format version."""
     _LOGGER.info("Migrating Virtual MRT entry from version %s", entry.version)
 
-    if entry.version == 1:
-        new_data = entry.data.copy()
-        new_data[CONF_CLIMATE_ENTITY] = None
-        new_data[CONF_FAN_ENTITY] = None
-        new_data[CONF_WINDOW_STATE_SENSOR] = None
-        new_data[CONF_DOOR_STATE_SENSOR] = None
-        new_data[CONF_SHADING_ENTITY] = None
-        new_data[CONF_HVAC_AIR_SPEED] = DEFAULT_AIR_SPEED_HVAC
-        new_data[CONF_MANUAL_AIR_SPEED] = DEFAULT_AIR_SPEED_STILL
-        new_data[CONF_RADIANT_TYPE] = "low_mass"
-        new_data[CONF_RADIANT_SURFACE_TEMP] = None
-
-        # We don't return True yet; we let it fall through to V3 migration logic if needed
-        entry.version = 2
+    version = entry.version
+    if version >= 4:
+        return True
 
-    # Handle V2 -> V3 (Adding Radiant Boolean)
-    if entry.version == 2:
-        # Ensure we work with the data (either from V1 migration or existing V2)
-        new_data = entry.data.copy() if "new_data" not in locals() else new_data
+    # Copy once and apply each version step to the same dict
+    new_data = dict(entry.data)
 
-        new_data[CONF_IS_RADIANT] = False  # Default to Forced Air
+    # Handle V1 -> V2 (Air speed, shading and radiant inputs)
+    if version == 1:
+        new_data.update(_V1_TO_V2_DEFAULTS)
 
-        hass.config_entries.async_update_entry(entry, data=new_data, version=3)
-        _LOGGER.info("Migration to version 3 successful for entry %s", entry.entry_id)
-        return True
+    # Handle V2 -> V3 (Adding Radiant Boolean)
+    if version <= 2:
+        new_data[CONF_IS_RADIANT] = False  # Default to Forced Air
 
     # Handle V3 -> v4 (Added aggregator flow, user is now a screen to choose adding a room or an aggregator)
-    if entry.version == 3:
-        # need to set some sane defaults?
-        new_data = entry.data.copy() if "new_data" not in locals() else new_data
-        # 1. Backfill Device Type (Old entries are always Rooms)
-        new_data.setdefault(CONF_DEVICE_TYPE, TYPE_ROOM)
-
-        # 2. Backfill Floor Level (Default to 1 / Main Floor)
-        new_data.setdefault(CONF_FLOOR_LEVEL, 1)
-
-        # 3. Backfill New Sensor Keys
-        new_data.setdefault(CONF_CALIBRATION_RH_SENSOR, None)
-        new_data.setdefault(CONF_PRECIPITATION_SENSOR, None)
-        new_data.setdefault(CONF_UV_INDEX_SENSOR, None)
-
-        hass.config_entries.async_update_entry(entry, data=new_data, version=4)
-        _LOGGER.info("Migration to version 4 successful for entry %s", entry.entry_id)
-        return True
-
+    # Only backfill, values already present are kept.
+    for key, default in _V3_TO_V4_DEFAULTS.items():
+        new_data.setdefault(key, default)
 
+    hass.config_entries.async_update_entry(entry, data=new_data, version=4)
+    _LOGGER.info("Migration to version 4 successful for entry %s", entry.entry_id)
     return True
 
 
@@ -139,23 +148,15 @@ async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of a config entry (cleanup logic)."""
-    store_key = f"{STORAGE_KEY}_{entry.entry_id}"
-    store_path = hass.config.path(STORAGE_DIR, store_key)
-
-    def delete_store_file():
-        if os.path.exists(store_path):
-            try:
-                os.remove(store_path)
-                return True
-            except OSError as err:
-                _LOGGER.error("Failed to delete storage file %s: %s", store_path, err)
-                return False
-        return True
-
-    success = await hass.async_add_executor_job(delete_store_file)
-
-    if not success:
-        _LOGGER.error("Failed to clean up persistent data for %s", entry.entry_id)
-
+    store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
+
+    # Store.async_remove does a single unlink and ignores a missing file,
+    # so there is no separate existence check to race against.
+    try:
+        await store.async_remove()
+    except OSError as err:
+        _LOGGER.error(
+            "Failed to clean up persistent data for %s: %s", entry.entry_id, err
+        )
 
     return True
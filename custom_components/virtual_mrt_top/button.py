@@ -20,8 +20,6 @@ from .const import (
     DOMAIN,
     ROOM_PROFILES,
     CUSTOM_PROFILE_KEY,
-    STORAGE_KEY,
-    STORAGE_VERSION,
     STORE_KEY_SAVED,
     MAX_SAVED_PROFILES,
     CONF_DEVICE_TYPE,
@@ -31,6 +29,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Unique-id suffixes of the profile number entities, in ROOM_PROFILES data order
+PROFILE_NUMBER_KEYS = ("f_out", "f_win", "k_loss", "k_solar")
+
+# Names that cannot be saved over or deleted (compared lowercased)
+RESERVED_PROFILE_NAMES = frozenset(
+    {CUSTOM_PROFILE_KEY, *(key.lower() for key in ROOM_PROFILES)}
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -39,11 +45,10 @@ async def async_setup_entry(
     config = entry.data
     if config.get(CONF_DEVICE_TYPE) == TYPE_AGGREGATOR:
         return
-    device_info = await get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
+    device_info = get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
 
-    # Each button gets access to the same storage file
-    store_key = f"{STORAGE_KEY}_{entry.entry_id}"
-    store = Store(hass, STORAGE_VERSION, store_key)
+    # Buttons share the entry's profile store with the select entity
+    store: Store = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
         [
@@ -69,20 +74,17 @@ class BaseProfileButton(ButtonEntity):
         self._entry = entry
         self._attr_device_info = device_info
         self._store = store
-
-    @property
-    def _entity_registry(self) -> er.EntityRegistry:
-        """Helper to get the entity registry."""
-        return er.async_get(self.hass)
+        self._uid_prefix = entry.entry_id + "_"
+        self._registry: er.EntityRegistry = er.async_get(hass)
 
     def _get_sibling_entity_id(self, platform: str, key: str) -> str | None:
         """Find a sibling entity from the same device."""
-        return self._entity_registry.async_get_entity_id(
-            platform, DOMAIN, f"{self._entry.entry_id}_{key}"
+        return self._registry.async_get_entity_id(
+            platform, DOMAIN, self._uid_prefix + key
         )
 
     async def _get_profile_name(self) -> str:
-        """Get the value from the text.profile_name entity, ensuring a string is returned."""
+        """Get the stripped value of the text.profile_name entity, or "" if unusable."""
         text_entity_id = self._get_sibling_entity_id("text", "profile_name")
 
         if not text_entity_id:
@@ -102,30 +104,16 @@ class BaseProfileButton(ButtonEntity):
 
     async def _get_current_number_values(self) -> list[float] | None:
         """Get the current values from the number entities."""
+        registry = self._registry
+        prefix = self._uid_prefix
         try:
-            values = [
-                float(
-                    self.hass.states.get(
-                        self._get_sibling_entity_id("number", "f_out")
-                    ).state
-                ),
-                float(
-                    self.hass.states.get(
-                        self._get_sibling_entity_id("number", "f_win")
-                    ).state
-                ),
-                float(
-                    self.hass.states.get(
-                        self._get_sibling_entity_id("number", "k_loss")
-                    ).state
-                ),
-                float(
-                    self.hass.states.get(
-                        self._get_sibling_entity_id("number", "k_solar")
-                    ).state
-                ),
+            states = [
+                self.hass.states.get(
+                    registry.async_get_entity_id("number", DOMAIN, prefix + key)
+                )
+                for key in PROFILE_NUMBER_KEYS
             ]
-            return values
+            return [float(state.state) for state in states]
         except (AttributeError, ValueError, TypeError):
             _LOGGER.error("Could not read all number entity states")
             return None
@@ -147,13 +135,11 @@ class SaveProfileButton(BaseProfileButton):
         name = await self._get_profile_name()
 
         # --- Validation 1: Check Name ---
-        if not name or name.strip() == "":
+        if not name:
             _LOGGER.error("Cannot save profile: name is empty")
             return
 
-        name = name.strip()
-
-        if name.lower() == CUSTOM_PROFILE_KEY or name in ROOM_PROFILES:
+        if name.lower() in RESERVED_PROFILE_NAMES:
             _LOGGER.error("Cannot save profile: '%s' is a reserved name", name)
             return
 
@@ -189,7 +175,7 @@ class SaveProfileButton(BaseProfileButton):
 
         # --- Save to Store ---
         data[STORE_KEY_SAVED][name] = values
-        await self._store.async_save(data)
+        self._store.async_delay_save(lambda: data, 0)
 
         _LOGGER.info("Saved new profile: '%s'", name)
 
@@ -218,13 +204,11 @@ class DeleteProfileButton(BaseProfileButton):
         name = await self._get_profile_name()
 
         # --- Validation ---
-        if not name or name.strip() == "":
+        if not name:
             _LOGGER.error("Cannot delete profile: name is empty")
             return
 
-        name = name.strip()
-
-        if name.lower() == CUSTOM_PROFILE_KEY or name in ROOM_PROFILES:
+        if name.lower() in RESERVED_PROFILE_NAMES:
             _LOGGER.error(
                 "Cannot delete profile: '%s' is a default/reserved profile", name
             )
@@ -239,18 +223,15 @@ class DeleteProfileButton(BaseProfileButton):
             return
 
         del data[STORE_KEY_SAVED][name]
-        await self._store.async_save(data)
+        self._store.async_delay_save(lambda: data, 0)
 
         _LOGGER.info("Deleted profile: '%s'", name)
         # clear the profile name textbox, after successful deletion
         text_entity_id = self._get_sibling_entity_id("text", "profile_name")
         if text_entity_id:
-            await self.hass.services.async_call(
-                "text",
-                "set_value",
-                {"entity_id": text_entity_id, "value": ""},
-                blocking=True,
-            )
+            text_entity = self.hass.data["text"].get_entity(text_entity_id)
+            if text_entity:
+                await text_entity.async_set_native_value("")
 
         # --- Refresh Select Entity ---
         select_entity_id = self._get_sibling_entity_id("select", "profile")
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import section
 from homeassistant.helpers import selector
-from homeassistant.helpers.selector import SelectSelectorMode
 
 from .const import (
     DOMAIN,
     CONF_ROOM_PROFILE,
-    ROOM_PROFILES,
+    ROOM_PROFILE_KEYS,
     CONF_ORIENTATION,
     ORIENTATION_OPTIONS,
     CONF_AIR_TEMP_SOURCE,
@@ -54,6 +58,355 @@ from .const import (
 )
 
 
+# Shared selectors; selector configs are immutable so one instance serves every form
+@lru_cache(maxsize=None)
+def _entity_selector(
+    domain: str | tuple[str, ...], device_class: str | tuple[str, ...] | None = None
+) -> selector.EntitySelector:
+    """
+    Interned entity selector. Tuples keep the arguments hashable and are
+    passed on as the lists the selector config schema requires.
+    """
+    config: dict[str, Any] = {
+        "domain": list(domain) if isinstance(domain, tuple) else domain
+    }
+    if device_class is not None:
+        config["device_class"] = (
+            list(device_class) if isinstance(device_class, tuple) else device_class
+        )
+    return selector.EntitySelector(selector.EntitySelectorConfig(**config))
+
+
+_SENSOR_SELECTOR = _entity_selector("sensor")
+_TEMPERATURE_SENSOR_SELECTOR = _entity_selector("sensor", "temperature")
+_HUMIDITY_SENSOR_SELECTOR = _entity_selector("sensor", "humidity")
+_PRESSURE_SENSOR_SELECTOR = _entity_selector(
+    "sensor", ("atmospheric_pressure", "pressure")
+)
+_WIND_SPEED_SENSOR_SELECTOR = _entity_selector("sensor", "wind_speed")
+_PRECIPITATION_SENSOR_SELECTOR = _entity_selector(
+    "sensor", ("precipitation", "precipitation_intensity")
+)
+_WEATHER_SELECTOR = _entity_selector("weather")
+_CLIMATE_SELECTOR = _entity_selector(Platform.CLIMATE)
+_FAN_SELECTOR = _entity_selector(Platform.FAN)
+_BINARY_SENSOR_SELECTOR = _entity_selector(Platform.BINARY_SENSOR)
+# Entities whose state can be read as a shading position
+_SHADING_DOMAINS = (
+    Platform.COVER,
+    Platform.BINARY_SENSOR,
+    Platform.SENSOR,
+    Platform.NUMBER,
+)
+_SHADING_SELECTOR = _entity_selector(_SHADING_DOMAINS)
+
+_ROOM_PROFILE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        # The selector config only accepts a list
+        options=list(ROOM_PROFILE_KEYS),
+        mode=selector.SelectSelectorMode.DROPDOWN,
+        translation_key="room_profile",
+    )
+)
+_ORIENTATION_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=list(ORIENTATION_OPTIONS),
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+
+_FLOOR_LEVEL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=-2, max=10, step=1, mode=selector.NumberSelectorMode.BOX
+    )
+)
+_ROOM_AREA_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1.0,
+        max=500.0,
+        step=0.1,
+        mode=selector.NumberSelectorMode.BOX,
+        unit_of_measurement="m²",
+    )
+)
+_UPDATE_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=300,
+        step=5,
+        unit_of_measurement="seconds",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_WALL_AREA_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.0, max=100.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
+        unit_of_measurement="m²"
+    )
+)
+_WINDOW_AREA_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.0, max=50.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
+        unit_of_measurement="m²"
+    )
+)
+_WINDOW_U_VALUE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.1, max=10.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
+        unit_of_measurement="W/m²K"
+    )
+)
+_AIR_SPEED_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.0,
+        max=1.5,
+        step=0.1,
+        mode=selector.NumberSelectorMode.BOX,
+        unit_of_measurement="m/s",
+    )
+)
+_CEILING_HEIGHT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=2.0,
+        max=5.0,
+        step=0.1,
+        unit_of_measurement="m",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_SOURCE_DEVICES_SELECTOR = selector.DeviceSelector(
+    selector.DeviceSelectorConfig(multiple=True, integration=DOMAIN)
+)
+
+
+# Section schemas shared by both flows; defaults are the setup values and the
+# options flow overlays the entry's current values (see _with_current_values)
+_SENSOR_FIELDS = (
+    (CONF_SOLAR_SENSOR, _SENSOR_SELECTOR),
+    (CONF_RH_SENSOR, _HUMIDITY_SENSOR_SELECTOR),
+    (CONF_WALL_SURFACE_SENSOR, _TEMPERATURE_SENSOR_SELECTOR),
+    (CONF_CALIBRATION_RH_SENSOR, _HUMIDITY_SENSOR_SELECTOR),
+    (CONF_PRESSURE_SENSOR, _PRESSURE_SENSOR_SELECTOR),
+    (CONF_OUTDOOR_TEMP_SENSOR, _TEMPERATURE_SENSOR_SELECTOR),
+    (CONF_OUTDOOR_HUMIDITY_SENSOR, _HUMIDITY_SENSOR_SELECTOR),
+    (CONF_WIND_SPEED_SENSOR, _WIND_SPEED_SENSOR_SELECTOR),
+    (CONF_PRECIPITATION_SENSOR, _PRECIPITATION_SENSOR_SELECTOR),
+    # UV often has no device class or "voltage" on generic devices
+    (CONF_UV_INDEX_SENSOR, _SENSOR_SELECTOR),
+)
+_SENSORS_SCHEMA = vol.Schema(
+    {vol.Optional(key): sensor_selector for key, sensor_selector in _SENSOR_FIELDS}
+)
+_GEOMETRY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_EXTERIOR_WALL_AREA): _WALL_AREA_SELECTOR,
+        vol.Optional(CONF_WINDOW_AREA, default=0.0): _WINDOW_AREA_SELECTOR,
+        vol.Optional(
+            CONF_WINDOW_U_VALUE, default=DEFAULT_WINDOW_U_VALUE
+        ): _WINDOW_U_VALUE_SELECTOR,
+    }
+)
+_CONVECTION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_CLIMATE_ENTITY): _CLIMATE_SELECTOR,
+        vol.Optional(CONF_FAN_ENTITY): _FAN_SELECTOR,
+        vol.Optional(CONF_WINDOW_STATE_SENSOR): _BINARY_SENSOR_SELECTOR,
+        vol.Optional(CONF_DOOR_STATE_SENSOR): _BINARY_SENSOR_SELECTOR,
+        vol.Optional(
+            CONF_MANUAL_AIR_SPEED, default=DEFAULT_AIR_SPEED_STILL
+        ): _AIR_SPEED_SELECTOR,
+    }
+)
+_ADVANCED_SCHEMA = vol.Schema({vol.Optional(CONF_SHADING_ENTITY): _SHADING_SELECTOR})
+
+_SENSORS_SECTION = section(_SENSORS_SCHEMA)
+_GEOMETRY_SECTION = section(_GEOMETRY_SCHEMA)
+_CONVECTION_SECTION = section(_CONVECTION_SCHEMA)
+_ADVANCED_SECTION = section(_ADVANCED_SCHEMA)
+
+
+def _suggested(value: Any) -> dict[str, Any] | None:
+    """Field description suggesting ``value``; None (no description) if unset."""
+    return None if value is None else {"suggested_value": value}
+
+
+def _with_current_values(
+    schema: vol.Schema, values: Mapping[str, Any]
+) -> vol.Schema:
+    """
+    Copy a shared schema pre-filled with an entry's current ``values``.
+    Required fields and fields with a default get the value as their default,
+    so an omitted field keeps it; optional fields without one get it as the
+    suggested value, so they can still be cleared. Only markers (and
+    sections) that receive a value are copied; the rest, and every selector,
+    are reused from the shared schema.
+    """
+    if not values:
+        return schema
+
+    fields = {}
+    changed = False
+    for marker, validator in schema.schema.items():
+        if isinstance(validator, section):
+            nested = _with_current_values(validator.schema, values)
+            if nested is not validator.schema:
+                validator = section(nested, validator.options)
+                changed = True
+        elif (value := values.get(marker.schema)) is not None:
+            if isinstance(marker, vol.Required) or marker.default is not vol.UNDEFINED:
+                marker = type(marker)(
+                    marker.schema,
+                    msg=marker.msg,
+                    default=value,
+                    description=marker.description,
+                )
+            else:
+                marker = copy.copy(marker)
+                marker.description = _suggested(value)
+            changed = True
+        fields[marker] = validator
+    return vol.Schema(fields) if changed else schema
+
+
+def _build_aggregator_schema(*, setup: bool = False) -> vol.Schema:
+    """Build the aggregator form; ``setup`` adds the name asked on creation."""
+    schema = {}
+    if setup:
+        schema[vol.Required(CONF_NAME)] = str
+    schema.update(
+        {
+            vol.Required(CONF_IS_HVAC_ZONE, default=False): _BOOLEAN_SELECTOR,
+            vol.Required(
+                CONF_CEILING_HEIGHT, default=DEFAULT_CEILING_HEIGHT
+            ): _CEILING_HEIGHT_SELECTOR,
+            vol.Required("source_devices"): _SOURCE_DEVICES_SELECTOR,
+        }
+    )
+    return vol.Schema(schema)
+
+
+def _build_room_schema(*, setup: bool = False) -> vol.Schema:
+    """
+    Build the room form shared by the setup and options flows.
+    ``setup`` adds the name and profile fields that only exist on creation.
+    """
+    schema = {}
+
+    # --- SECTION 1: CORE (Always Visible) ---
+    if setup:
+        schema[vol.Required(CONF_NAME)] = str
+    schema.update(
+        {
+            vol.Required(CONF_FLOOR_LEVEL, default=1): _FLOOR_LEVEL_SELECTOR,
+            vol.Required(CONF_AIR_TEMP_SOURCE): _TEMPERATURE_SENSOR_SELECTOR,
+            vol.Required(CONF_WEATHER_ENTITY): _WEATHER_SELECTOR,
+        }
+    )
+    if setup:
+        schema[
+            vol.Required(CONF_ROOM_PROFILE, default="one_wall_large_window")
+        ] = _ROOM_PROFILE_SELECTOR
+    schema.update(
+        {
+            vol.Required(
+                CONF_ORIENTATION, default=DEFAULT_ORIENTATION
+            ): _ORIENTATION_SELECTOR,
+            vol.Required(CONF_ROOM_AREA, default=15.0): _ROOM_AREA_SELECTOR,
+            # Required on creation; the options form may leave it out
+            (vol.Required if setup else vol.Optional)(
+                CONF_MIN_UPDATE_INTERVAL, default=DEFAULT_MIN_UPDATE_INTERVAL
+            ): _UPDATE_INTERVAL_SELECTOR,
+            vol.Required(CONF_IS_RADIANT, default=False): _BOOLEAN_SELECTOR,
+            # --- SECTION 2: OPTIONAL SENSORS ---
+            vol.Optional("sensors_section"): _SENSORS_SECTION,
+            # --- GEOMETRY WALL/WINDOW ---
+            vol.Optional("geometry_section"): _GEOMETRY_SECTION,
+            # --- SECTION 3: CONVECTION & AIRFLOW ---
+            vol.Optional("convection_section"): _CONVECTION_SECTION,
+            # --- SECTION 4: ADVANCED ---
+            vol.Optional("advanced_section"): _ADVANCED_SECTION,
+        }
+    )
+    return vol.Schema(schema)
+
+
+_SETUP_MENU_OPTIONS = ["room_setup", "aggregator_setup"]
+
+# Forms are built once at import rather than on every render. The options
+# skeletons get the entry's current values overlaid per entry.
+_AGGREGATOR_SETUP_SCHEMA = _build_aggregator_schema(setup=True)
+_ROOM_SETUP_SCHEMA = _build_room_schema(setup=True)
+_AGGREGATOR_OPTIONS_SCHEMA = _build_aggregator_schema()
+_ROOM_OPTIONS_SCHEMA = _build_room_schema()
+
+
+@lru_cache(maxsize=64)
+def _cached_room_schema(current: tuple[tuple[str, Any], ...]) -> vol.Schema:
+    """Memoize the options room form; reopening an unchanged entry reuses it."""
+    return _with_current_values(_ROOM_OPTIONS_SCHEMA, dict(current))
+
+
+# Room option fields as (key, default when unset)
+_ROOM_OPTION_DEFAULTS = (
+    (CONF_AIR_TEMP_SOURCE, None),
+    (CONF_ORIENTATION, DEFAULT_ORIENTATION),
+    (CONF_WEATHER_ENTITY, None),
+    (CONF_SOLAR_SENSOR, None),
+    (CONF_RH_SENSOR, None),
+    (CONF_CLIMATE_ENTITY, None),
+    (CONF_FAN_ENTITY, None),
+    (CONF_WINDOW_STATE_SENSOR, None),
+    (CONF_DOOR_STATE_SENSOR, None),
+    (CONF_MANUAL_AIR_SPEED, DEFAULT_AIR_SPEED_STILL),
+    (CONF_SHADING_ENTITY, None),
+    (CONF_IS_RADIANT, False),
+    (CONF_CALIBRATION_RH_SENSOR, None),
+    (CONF_WALL_SURFACE_SENSOR, None),
+    (CONF_OUTDOOR_HUMIDITY_SENSOR, None),
+    (CONF_OUTDOOR_TEMP_SENSOR, None),
+    (CONF_WIND_SPEED_SENSOR, None),
+    (CONF_PRESSURE_SENSOR, None),
+    (CONF_PRECIPITATION_SENSOR, None),
+    (CONF_UV_INDEX_SENSOR, None),
+    (CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL),
+    (CONF_ROOM_AREA, 15.0),
+    (CONF_FLOOR_LEVEL, 1),
+    (CONF_EXTERIOR_WALL_AREA, None),
+    (CONF_WINDOW_AREA, 0.0),
+    (CONF_WINDOW_U_VALUE, DEFAULT_WINDOW_U_VALUE),
+)
+
+# Aggregator option fields as (key, default when unset)
+_AGGREGATOR_OPTION_DEFAULTS = (
+    ("source_devices", []),
+    (CONF_CEILING_HEIGHT, DEFAULT_CEILING_HEIGHT),
+    (CONF_IS_HVAC_ZONE, False),
+)
+
+
+def _current_values(
+    data: Mapping[str, Any], fields: tuple[tuple[str, Any], ...]
+) -> dict[str, Any]:
+    """Current value of each field in ``data``; a stored None falls back to the default."""
+    return {
+        key: default if (value := data.get(key)) is None else value
+        for key, default in fields
+    }
+
+
+# Room options form for an entry with no stored data yet
+_DEFAULT_ROOM_OPTIONS_SCHEMA = _with_current_values(
+    _ROOM_OPTIONS_SCHEMA, _current_values({}, _ROOM_OPTION_DEFAULTS)
+)
+
+
+# Form sections whose fields are stored flat in the entry data
+_SECTION_KEYS = frozenset(
+    ("sensors_section", "geometry_section", "convection_section", "advanced_section")
+)
+
+
 def _flatten_input(user_input: dict) -> dict:
     """
     Helper: Flatten nested section dictionaries into the top level.
@@ -64,7 +417,8 @@ def _flatten_input(user_input: dict) -> dict:
 
     flat = {}
     for key, value in user_input.items():
-        if isinstance(value, dict) and key.endswith("_section"):
+        # The flow manager hands sections over as plain dicts
+        if key in _SECTION_KEYS and type(value) is dict:
             flat.update(value)
         else:
             flat[key] = value
@@ -81,50 +435,22 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     @callback
     def async_get_options_flow(config_entry):
         """Get the options flow for this handler."""
-        return OptionsFlowHandler(config_entry)
+        # The flow manager attaches config_entry to the handler itself
+        return OptionsFlowHandler()
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step (Menu)."""
-        return self.async_show_menu(
-            step_id="user", menu_options=["room_setup", "aggregator_setup"]
-        )
+        return self.async_show_menu(step_id="user", menu_options=_SETUP_MENU_OPTIONS)
 
     async def async_step_aggregator_setup(self, user_input=None):
         """Handle the setup for a Zone Aggregator."""
         if user_input is not None:
-            # Aggregator doesn't use sections, so no flattening needed yet
-            data = {
-                CONF_NAME: user_input[CONF_NAME],
-                CONF_DEVICE_TYPE: TYPE_AGGREGATOR,
-                "source_devices": user_input["source_devices"],
-                CONF_IS_HVAC_ZONE: user_input[CONF_IS_HVAC_ZONE],
-                CONF_CEILING_HEIGHT: user_input[CONF_CEILING_HEIGHT],
-            }
+            # The flow manager has already validated user_input against
+            # _AGGREGATOR_SETUP_SCHEMA (no sections, no extra keys), so store it as-is
+            data = {**user_input, CONF_DEVICE_TYPE: TYPE_AGGREGATOR}
             return self.async_create_entry(title=user_input[CONF_NAME], data=data)
 
-        return self.async_show_form(
-            step_id="aggregator_setup",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_NAME): str,
-                    vol.Required(CONF_IS_HVAC_ZONE, default=False): selector.BooleanSelector(),
-                    vol.Required(
-                        CONF_CEILING_HEIGHT, default=2.7
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=2.0,
-                            max=5.0,
-                            step=0.1,
-                            unit_of_measurement="m",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required("source_devices"): selector.DeviceSelector(
-                        selector.DeviceSelectorConfig(multiple=True, integration=DOMAIN)
-                    ),
-                }
-            ),
-        )
+        return self.async_show_form(step_id="aggregator_setup", data_schema=_AGGREGATOR_SETUP_SCHEMA)
 
     async def async_step_room_setup(self, user_input=None):
         """Handle the standard Room setup."""
@@ -135,571 +461,82 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             flat_input[CONF_DEVICE_TYPE] = TYPE_ROOM
             return self.async_create_entry(title=flat_input[CONF_NAME], data=flat_input)
 
-        profile_keys = list(ROOM_PROFILES.keys())
-
-        return self.async_show_form(
-            step_id="room_setup",
-            data_schema=vol.Schema(
-                {
-                    # --- SECTION 1: CORE (Always Visible) ---
-                    vol.Required(CONF_NAME): str,
-                    vol.Required(CONF_FLOOR_LEVEL, default=1): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=-2, max=10, step=1, mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-                    vol.Required(CONF_AIR_TEMP_SOURCE): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="sensor", device_class="temperature"
-                        )
-                    ),
-                    vol.Required(CONF_WEATHER_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="weather")
-                    ),
-                    vol.Required(
-                        CONF_ROOM_PROFILE, default="one_wall_large_window"
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=profile_keys,
-                            mode=SelectSelectorMode.DROPDOWN,
-                            translation_key="room_profile",
-                        )
-                    ),
-                    vol.Required(
-                        CONF_ORIENTATION, default="S"
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=ORIENTATION_OPTIONS,
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Required(CONF_ROOM_AREA, default=15.0): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1.0,
-                            max=500.0,
-                            step=0.1,
-                            mode=selector.NumberSelectorMode.BOX,
-                            unit_of_measurement="m²",
-                        )
-                    ),
-                    vol.Required(
-                        CONF_MIN_UPDATE_INTERVAL, default=DEFAULT_MIN_UPDATE_INTERVAL
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=300,
-                            step=5,
-                            unit_of_measurement="seconds",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_IS_RADIANT, default=False
-                    ): selector.BooleanSelector(),
-                    # --- SECTION 2: OPTIONAL SENSORS ---
-                    vol.Optional("sensors_section"): section(
-                        vol.Schema(
-                            {
-                                vol.Optional(
-                                    CONF_SOLAR_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(domain="sensor")
-                                ),
-                                vol.Optional(CONF_RH_SENSOR): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor", device_class="humidity"
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_WALL_SURFACE_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor", device_class="temperature"
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_CALIBRATION_RH_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor", device_class="humidity"
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_PRESSURE_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor",
-                                        device_class=[
-                                            "atmospheric_pressure",
-                                            "pressure",
-                                        ],
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_OUTDOOR_TEMP_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor", device_class="temperature"
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_OUTDOOR_HUMIDITY_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor", device_class="humidity"
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_WIND_SPEED_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor", device_class="wind_speed"
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_PRECIPITATION_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor",
-                                        device_class=["precipitation", "precipitation_intensity"]
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_UV_INDEX_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain="sensor"  # UV often has no device class or "voltage" on generic devices
-                                    )
-                                ),
-                            }
-                        )
-                    ),
-                    # --- GEOMETRY WALL/WINDOW ---
-                    vol.Optional("geometry_section"): section(
-                        vol.Schema(
-                            {
-                                vol.Optional(CONF_EXTERIOR_WALL_AREA): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0.0, max=100.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
-                                        unit_of_measurement="m²"
-                                    )
-                                ),
-                                vol.Optional(CONF_WINDOW_AREA, default=0.0): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0.0, max=50.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
-                                        unit_of_measurement="m²"
-                                    )
-                                ),
-                                vol.Optional(CONF_WINDOW_U_VALUE,
-                                             default=DEFAULT_WINDOW_U_VALUE): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0.1, max=10.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
-                                        unit_of_measurement="W/m²K"
-                                    )
-                                ),
-                            }
-                        )
-                    ),
-                    # --- SECTION 3: CONVECTION & AIRFLOW ---
-                    vol.Optional("convection_section"): section(
-                        vol.Schema(
-                            {
-                                vol.Optional(
-                                    CONF_CLIMATE_ENTITY
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain=Platform.CLIMATE
-                                    )
-                                ),
-                                vol.Optional(CONF_FAN_ENTITY): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(domain=Platform.FAN)
-                                ),
-                                vol.Optional(
-                                    CONF_WINDOW_STATE_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain=Platform.BINARY_SENSOR
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_DOOR_STATE_SENSOR
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain=Platform.BINARY_SENSOR
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_MANUAL_AIR_SPEED,
-                                    default=DEFAULT_AIR_SPEED_STILL,
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0.0,
-                                        max=1.5,
-                                        step=0.1,
-                                        mode=selector.NumberSelectorMode.BOX,
-                                        unit_of_measurement="m/s",
-                                    )
-                                ),
-                            }
-                        )
-                    ),
-                    # --- SECTION 4: ADVANCED ---
-                    vol.Optional("advanced_section"): section(
-                        vol.Schema(
-                            {
-                                vol.Optional(
-                                    CONF_SHADING_ENTITY
-                                ): selector.EntitySelector(
-                                    selector.EntitySelectorConfig(
-                                        domain=[
-                                            Platform.COVER,
-                                            Platform.BINARY_SENSOR,
-                                            Platform.SENSOR,
-                                            Platform.NUMBER,
-                                        ]
-                                    )
-                                ),
-                            }
-                        )
-                    ),
-                }
-            ),
-        )
+        return self.async_show_form(step_id="room_setup", data_schema=_ROOM_SETUP_SCHEMA)
 
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handles options flow for the component."""
 
-    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
-        """Initialize options flow."""
-        pass
+    # Room options form for this entry, built on first render
+    _room_schema: vol.Schema | None = None
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
-        # -----------------------------------------------------------
-        # BRANCH 1: AGGREGATOR OPTIONS
-        # -----------------------------------------------------------
-        if self.config_entry.data.get(CONF_DEVICE_TYPE) == TYPE_AGGREGATOR:
-            if user_input is not None:
-                # Update aggregator configuration
-                new_data = self.config_entry.data.copy()
-                new_data.update(user_input)
+        handlers = self._OPTIONS_HANDLERS
+        handler = handlers.get(
+            self.config_entry.data.get(CONF_DEVICE_TYPE), handlers[TYPE_ROOM]
+        )
+        return await handler(self, user_input)
+
+    # -----------------------------------------------------------
+    # AGGREGATOR OPTIONS
+    # -----------------------------------------------------------
+    async def _async_aggregator_options(self, user_input=None):
+        """Edit the aggregator's included devices and zone settings."""
+        if user_input is not None:
+            # Update aggregator configuration
+            data = self.config_entry.data
+            new_data = {**data, **user_input}
+            if new_data != data:
                 self.hass.config_entries.async_update_entry(
                     self.config_entry, data=new_data
                 )
-                return self.async_create_entry(title="", data=None)
-
-            # Show Aggregator Form (Edit included devices)
-            current_devices = self.config_entry.data.get("source_devices", [])
-            ceiling_height = self.config_entry.data.get(
-                CONF_CEILING_HEIGHT, DEFAULT_CEILING_HEIGHT
-            )
-            is_hvac = self.config_entry.data.get(CONF_IS_HVAC_ZONE, False)
-            return self.async_show_form(
-                step_id="init",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required(CONF_IS_HVAC_ZONE, default=is_hvac): selector.BooleanSelector(),
-                        vol.Required(
-                            CONF_CEILING_HEIGHT, default=ceiling_height
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=2.0,
-                                max=5.0,
-                                step=0.1,
-                                unit_of_measurement="m",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
-                        vol.Required(
-                            "source_devices", default=current_devices
-                        ): selector.DeviceSelector(
-                            selector.DeviceSelectorConfig(
-                                multiple=True, integration=DOMAIN
-                            )
-                        ),
-                    }
-                ),
-            )
-
-        # -----------------------------------------------------------
-        # BRANCH 2: ROOM OPTIONS (Existing Logic)
-        # -----------------------------------------------------------
-        if user_input is not None:
-            # Flatten inputs from sections
-            flat_input = _flatten_input(user_input)
-
-            # Merge new options with old data
-            new_data = self.config_entry.data.copy()
-            new_data.update(flat_input)
-
-            self.hass.config_entries.async_update_entry(
-                self.config_entry, data=new_data
-            )
             return self.async_create_entry(title="", data=None)
 
-        # --- DATA RETRIEVAL HELPER ---
-        def _get_data(string_key, constant_key, default=None):
-            val = self.config_entry.data.get(string_key)
-            if val is None:
-                val = self.config_entry.data.get(constant_key)
-            if val is None:
-                return default
-            return val
-
-        # Retrieve current values
-        # NOTE: We keep required sensor sources here so users can update them.
-        air_temp = _get_data("air_temp_source", CONF_AIR_TEMP_SOURCE)
-        orientation = _get_data("orientation", CONF_ORIENTATION, DEFAULT_ORIENTATION)
-        weather = _get_data("weather_entity", CONF_WEATHER_ENTITY)
-
-        solar = _get_data("solar_sensor", CONF_SOLAR_SENSOR)
-        rh = _get_data("rh_sensor", CONF_RH_SENSOR)
-
-        climate = _get_data("climate_entity", CONF_CLIMATE_ENTITY)
-        fan = _get_data("fan_entity", CONF_FAN_ENTITY)
-        window = _get_data("window_state_sensor", CONF_WINDOW_STATE_SENSOR)
-        door = _get_data("door_state_sensor", CONF_DOOR_STATE_SENSOR)
-        manual_speed = _get_data(
-            "manual_air_speed", CONF_MANUAL_AIR_SPEED, DEFAULT_AIR_SPEED_STILL
+        # Show Aggregator Form (Edit included devices)
+        current = _current_values(
+            self.config_entry.data, _AGGREGATOR_OPTION_DEFAULTS
         )
-        shading = _get_data("shading_entity", CONF_SHADING_ENTITY)
-
-        is_radiant = _get_data("is_radiant_heating", CONF_IS_RADIANT, False)
-        cal_rh_sensor = _get_data("calibration_rh_sensor", CONF_CALIBRATION_RH_SENSOR)  # <--- NEW
-        wall_sensor = _get_data("wall_surface_sensor", CONF_WALL_SURFACE_SENSOR)
-        out_hum = _get_data("outdoor_humidity_sensor", CONF_OUTDOOR_HUMIDITY_SENSOR)
-        out_temp = _get_data("outdoor_temp_sensor", CONF_OUTDOOR_TEMP_SENSOR)
-        wind = _get_data("wind_speed_sensor", CONF_WIND_SPEED_SENSOR)
-        pressure = _get_data("pressure_sensor", CONF_PRESSURE_SENSOR)
-        precip = _get_data("precipitation_sensor", CONF_PRECIPITATION_SENSOR)
-        uv_idx = _get_data("uv_index_sensor", CONF_UV_INDEX_SENSOR)
-
-        min_interval = _get_data(
-            "min_update_interval", CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+        return self.async_show_form(
+            step_id="init",
+            data_schema=_with_current_values(_AGGREGATOR_OPTIONS_SCHEMA, current),
         )
-        room_area = _get_data("room_area", CONF_ROOM_AREA, 15.0)
-        floor = _get_data("floor_level", CONF_FLOOR_LEVEL, 1)
-        gross_wall = self.config_entry.data.get(CONF_EXTERIOR_WALL_AREA)
-        win_area = self.config_entry.data.get(CONF_WINDOW_AREA, 0.0)
-        win_u = self.config_entry.data.get(CONF_WINDOW_U_VALUE, DEFAULT_WINDOW_U_VALUE)
-
-        schema = {
-            # --- CORE ---
-            vol.Required(CONF_FLOOR_LEVEL, default=floor): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=-2, max=10, step=1, mode=selector.NumberSelectorMode.BOX
-                )
-            ),
-            vol.Required("air_temp_source", default=air_temp): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor", device_class="temperature"
-                )
-            ),
-            vol.Required("weather_entity", default=weather): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="weather")
-            ),
-            vol.Required("orientation", default=orientation): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=ORIENTATION_OPTIONS, mode=SelectSelectorMode.DROPDOWN
-                )
-            ),
-            vol.Required(CONF_ROOM_AREA, default=room_area): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1.0,
-                    max=500.0,
-                    step=0.1,
-                    mode=selector.NumberSelectorMode.BOX,
-                    unit_of_measurement="m²",
-                )
-            ),
-            vol.Optional(
-                CONF_MIN_UPDATE_INTERVAL, default=min_interval
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=0,
-                    max=300,
-                    step=5,
-                    unit_of_measurement="seconds",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Required(
-                "is_radiant_heating", default=is_radiant
-            ): selector.BooleanSelector(),
-            # --- SECTION: OPTIONAL SENSORS ---
-            vol.Optional("sensors_section"): section(
-                vol.Schema(
-                    {
-                        vol.Optional(
-                            "solar_sensor", description={"suggested_value": solar}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(domain="sensor")
-                        ),
-                        vol.Optional(
-                            "rh_sensor", description={"suggested_value": rh}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor", device_class="humidity"
-                            )
-                        ),
-                        vol.Optional(
-                            "wall_surface_sensor",
-                            description={"suggested_value": wall_sensor},
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor", device_class="temperature"
-                            )
-                        ),
-                        vol.Optional(
-                            "calibration_rh_sensor",
-                            description={"suggested_value": cal_rh_sensor},
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor", device_class="humidity"
-                            )
-                        ),
-                        vol.Optional(
-                            "pressure_sensor", description={"suggested_value": pressure}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor",
-                                device_class=["atmospheric_pressure", "pressure"],
-                            )
-                        ),
-                        vol.Optional(
-                            "outdoor_temp_sensor",
-                            description={"suggested_value": out_temp},
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor", device_class="temperature"
-                            )
-                        ),
-                        vol.Optional(
-                            "outdoor_humidity_sensor",
-                            description={"suggested_value": out_hum},
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor", device_class="humidity"
-                            )
-                        ),
-                        vol.Optional(
-                            "wind_speed_sensor", description={"suggested_value": wind}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor", device_class="wind_speed"
-                            )
-                        ),
-                        vol.Optional(
-                            CONF_PRECIPITATION_SENSOR, description={"suggested_value": precip}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor",
-                                device_class=["precipitation", "precipitation_intensity"]
-                            )
-                        ),
-                        vol.Optional(
-                            CONF_UV_INDEX_SENSOR, description={"suggested_value": uv_idx}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain="sensor"  # UV often has no device class or "voltage" on generic devices
-                            )
-                        ),
-                    }
-                )
-            ),
-            # --- SECTION: GEOMETRY WALL/WINDOW ---
-            vol.Optional("geometry_section"): section(
-                vol.Schema(
-                    {
-                        vol.Optional(
-                            CONF_EXTERIOR_WALL_AREA,
-                            description={"suggested_value": gross_wall}
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0.0, max=100.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
-                                unit_of_measurement="m²"
-                            )
-                        ),
-                        vol.Optional(
-                            CONF_WINDOW_AREA,
-                            default=win_area
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0.0, max=50.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
-                                unit_of_measurement="m²"
-                            )
-                        ),
-                        vol.Optional(
-                            CONF_WINDOW_U_VALUE,
-                            default=win_u
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0.1, max=10.0, step=0.1, mode=selector.NumberSelectorMode.BOX,
-                                unit_of_measurement="W/m²K"
-                            )
-                        ),
-                    }
-                )
-            ),
-            # --- SECTION: CONVECTION ---
-            vol.Optional("convection_section"): section(
-                vol.Schema(
-                    {
-                        vol.Optional(
-                            "climate_entity", description={"suggested_value": climate}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(domain=Platform.CLIMATE)
-                        ),
-                        vol.Optional(
-                            "fan_entity", description={"suggested_value": fan}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(domain=Platform.FAN)
-                        ),
-                        vol.Optional(
-                            "window_state_sensor",
-                            description={"suggested_value": window},
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(domain=Platform.BINARY_SENSOR)
-                        ),
-                        vol.Optional(
-                            "door_state_sensor", description={"suggested_value": door}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(domain=Platform.BINARY_SENSOR)
-                        ),
-                        vol.Optional(
-                            "manual_air_speed", default=manual_speed
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0.0,
-                                max=1.5,
-                                step=0.1,
-                                mode=selector.NumberSelectorMode.BOX,
-                                unit_of_measurement="m/s",
-                            )
-                        ),
-                    }
-                )
-            ),
-            # --- SECTION: ADVANCED ---
-            vol.Optional("advanced_section"): section(
-                vol.Schema(
-                    {
-                        vol.Optional(
-                            "shading_entity", description={"suggested_value": shading}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(
-                                domain=[
-                                    Platform.COVER,
-                                    Platform.BINARY_SENSOR,
-                                    Platform.SENSOR,
-                                    Platform.NUMBER,
-                                ]
-                            )
-                        ),
-                    }
+
+    # -----------------------------------------------------------
+    # ROOM OPTIONS
+    # -----------------------------------------------------------
+    async def _async_room_options(self, user_input=None):
+        """Edit the room's sensors, geometry and airflow settings."""
+        if user_input is not None:
+            # Flatten inputs from sections
+            flat_input = _flatten_input(user_input)
+
+            # Merge new options with old data; an unchanged form must not
+            # trigger the update listener (and with it a full entry reload)
+            data = self.config_entry.data
+            new_data = {**data, **flat_input}
+            if new_data != data:
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry, data=new_data
                 )
-            ),
-        }
+                self._room_schema = None
+            return self.async_create_entry(title="", data=None)
 
-        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
+        if self._room_schema is None:
+            data = self.config_entry.data
+            if not data:
+                self._room_schema = _DEFAULT_ROOM_OPTIONS_SCHEMA
+            else:
+                # Retrieve current values
+                # NOTE: We keep required sensor sources here so users can update them.
+                current = _current_values(data, _ROOM_OPTION_DEFAULTS)
+                # current is built in a fixed order from hashable config values
+                self._room_schema = _cached_room_schema(tuple(current.items()))
+
+        return self.async_show_form(step_id="init", data_schema=self._room_schema)
+
+    # Device type -> options step; anything that is not an aggregator is a room
+    _OPTIONS_HANDLERS = {
+        TYPE_AGGREGATOR: _async_aggregator_options,
+        TYPE_ROOM: _async_room_options,
+    }
@@ -1,6 +1,8 @@
 """Constants for the Virtual MRT integration."""
 
-from typing import Iterable
+import math
+from types import MappingProxyType
+from typing import Any
 
 DOMAIN = "virtual_mrt_top"
 
@@ -56,7 +58,7 @@ CONF_PRECIPITATION_SENSOR = "precipitation_sensor"
 CONF_UV_INDEX_SENSOR = "uv_index_sensor"
 CONF_IS_HVAC_ZONE = "is_hvac_zone"
 
-ORIENTATION_OPTIONS = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+ORIENTATION_OPTIONS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
 
 # RADIANT_TYPES now defines Speed (alpha) AND Geometry (view_factor)
 RADIANT_TYPES = {
@@ -80,6 +82,9 @@ RADIANT_TYPES = {
     },
 }
 
+# Radiant system keys in display order
+RADIANT_TYPE_KEYS: tuple[str, ...] = tuple(RADIANT_TYPES)
+
 # --- DEFAULT AIR SPEED MODELING (m/s) ---
 DEFAULT_AIR_SPEED_STILL = 0.1
 DEFAULT_AIR_SPEED_HVAC = 0.4
@@ -87,87 +92,109 @@ DEFAULT_AIR_SPEED_WINDOW = 0.5
 DEFAULT_AIR_SPEED_DOOR = 0.8
 
 DEFAULT_ORIENTATION = "S"
-ORIENTATION_DEGREES = {
-    "N": 0,
-    "NE": 45,
-    "E": 90,
-    "SE": 135,
-    "S": 180,
-    "SW": 225,
-    "W": 270,
-    "NW": 315,
-}
+ORIENTATION_DEGREES = MappingProxyType(
+    {
+        "N": 0,
+        "NE": 45,
+        "E": 90,
+        "SE": 135,
+        "S": 180,
+        "SW": 225,
+        "W": 270,
+        "NW": 315,
+    }
+)
+
+# Same orientations in radians, for the solar incidence math
+ORIENTATION_RADIANS = MappingProxyType(
+    {code: math.radians(degrees) for code, degrees in ORIENTATION_DEGREES.items()}
+)
 
 # Mapping common fan states (must be lowercase) to air velocity (m/s)
-FAN_SPEED_MAP = {
-    "low": 0.3,
-    "medium": 0.5,
-    "high": 0.8,
-    "on": 0.4,  # Generic on state
-    "1": 0.3,  # Numerical low
-    "2": 0.5,
-    "3": 0.8,
-    "auto": 0.4,  # For fans with auto mode
-}
+FAN_SPEED_MAP = MappingProxyType(
+    {
+        "low": 0.3,
+        "medium": 0.5,
+        "high": 0.8,
+        "on": 0.4,  # Generic on state
+        "1": 0.3,  # Numerical low
+        "2": 0.5,
+        "3": 0.8,
+        "auto": 0.4,  # For fans with auto mode
+    }
+)
 
 # Profile Data: [f_out, f_win, k_loss, k_solar]
-ROOM_PROFILES = {
-    "one_wall_large_window": {
-        "label": "1 ext wall, large window",
-        "data": [0.5, 0.40, 0.14, 1.20],
-    },
-    "two_wall_large_window": {
-        "label": "2 ext walls, large window",
-        "data": [0.8, 0.50, 0.16, 1.40],
-    },
-    "attic": {"label": "Top floor (tilted/high gain)", "data": [0.9, 0.40, 0.20, 1.50]},
-    "topfloor_vert_small_window": {
-        "label": "Top floor (vert/small win)",
-        "data": [0.9, 0.15, 0.23, 0.75],
-    },
-    "topfloor_vert_medium_window": {
-        "label": "Top floor (vert/med win)",
-        "data": [0.9, 0.30, 0.22, 1.00],
-    },
-    "topfloor_two_walls_cavity": {
-        "label": "Top floor (2 walls/cavity)",
-        "data": [0.95, 0.25, 0.24, 0.95],
-    },
-    "topfloor_cold_adjacent": {
-        "label": "Top floor (cold adjacent)",
-        "data": [0.95, 0.35, 0.23, 1.15],
-    },
-    "two_wall_small_window": {
-        "label": "2 ext walls, small window",
-        "data": [0.7, 0.30, 0.16, 1.00],
-    },
-    "one_wall_small_window": {
-        "label": "1 ext wall, small window",
-        "data": [0.5, 0.20, 0.12, 0.80],
-    },
-    "basement": {"label": "Basement / semi-basement", "data": [0.4, 0.20, 0.10, 0.60]},
-    "one_wall_cold_adjacent": {
-        "label": "1 ext wall, cold adjacent",
-        "data": [0.6, 0.30, 0.18, 0.80],
-    },
-    "corner_cold_adjacent": {
-        "label": "Corner room, cold adjacent",
-        "data": [0.8, 0.40, 0.20, 1.00],
-    },
-    "interior": {"label": "Interior room", "data": [0.0, 0.00, 0.08, 0.40]},
-    "interior_cold_adjacent": {
-        "label": "Interior, cold adjacent",
-        "data": [0.3, 0.00, 0.12, 0.40],
-    },
-}
+ROOM_PROFILES = MappingProxyType(
+    {
+        "one_wall_large_window": {
+            "label": "1 ext wall, large window",
+            "data": [0.5, 0.40, 0.14, 1.20],
+        },
+        "two_wall_large_window": {
+            "label": "2 ext walls, large window",
+            "data": [0.8, 0.50, 0.16, 1.40],
+        },
+        "attic": {
+            "label": "Top floor (tilted/high gain)",
+            "data": [0.9, 0.40, 0.20, 1.50],
+        },
+        "topfloor_vert_small_window": {
+            "label": "Top floor (vert/small win)",
+            "data": [0.9, 0.15, 0.23, 0.75],
+        },
+        "topfloor_vert_medium_window": {
+            "label": "Top floor (vert/med win)",
+            "data": [0.9, 0.30, 0.22, 1.00],
+        },
+        "topfloor_two_walls_cavity": {
+            "label": "Top floor (2 walls/cavity)",
+            "data": [0.95, 0.25, 0.24, 0.95],
+        },
+        "topfloor_cold_adjacent": {
+            "label": "Top floor (cold adjacent)",
+            "data": [0.95, 0.35, 0.23, 1.15],
+        },
+        "two_wall_small_window": {
+            "label": "2 ext walls, small window",
+            "data": [0.7, 0.30, 0.16, 1.00],
+        },
+        "one_wall_small_window": {
+            "label": "1 ext wall, small window",
+            "data": [0.5, 0.20, 0.12, 0.80],
+        },
+        "basement": {
+            "label": "Basement / semi-basement",
+            "data": [0.4, 0.20, 0.10, 0.60],
+        },
+        "one_wall_cold_adjacent": {
+            "label": "1 ext wall, cold adjacent",
+            "data": [0.6, 0.30, 0.18, 0.80],
+        },
+        "corner_cold_adjacent": {
+            "label": "Corner room, cold adjacent",
+            "data": [0.8, 0.40, 0.20, 1.00],
+        },
+        "interior": {"label": "Interior room", "data": [0.0, 0.00, 0.08, 0.40]},
+        "interior_cold_adjacent": {
+            "label": "Interior, cold adjacent",
+            "data": [0.3, 0.00, 0.12, 0.40],
+        },
+    }
+)
 
+# Built-in profile keys in display order
+ROOM_PROFILE_KEYS: tuple[str, ...] = tuple(ROOM_PROFILES)
 
-async def get_device_info(identifier: Iterable, name: str):
-    device_info = {
-        "identifiers": identifier,
-        "name": name,
+
+# Static part of every device's info; callers get their own copy to adjust
+_BASE_DEVICE_INFO = MappingProxyType(
+    {
         "manufacturer": "Virtual MRT/T_op",
         "model": "Configurable Room",
     }
+)
+
 
-    return device_info
+def get_device_info(identifier: set[tuple[str, str]], name: str) -> dict[str, Any]:
+    return {**_BASE_DEVICE_INFO, "identifiers": identifier, "name": name}
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass
+from typing import Callable, List
 
 from homeassistant.components.number import (
     NumberMode,
@@ -14,9 +15,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
 
-from . import CONF_IS_RADIANT
 from .const import (
     DOMAIN,
+    CONF_IS_RADIANT,
     CONF_ROOM_PROFILE,
     ROOM_PROFILES,
     CONF_THERMAL_ALPHA,
@@ -31,6 +32,140 @@ from .const import (
 )
 
 
+def _clamp_thermal_alpha(value: float) -> float:
+    """Keep the smoothing factor usable, although the UI should prevent it."""
+    return min(0.95, max(0.05, value))
+
+
+def _clamp_non_negative(value: float) -> float:
+    """Clamp air speeds to a minimum of 0.0."""
+    return max(0.0, value)
+
+
+@dataclass(frozen=True, slots=True)
+class NumberSpec:
+    """Static description of one VirtualNumber."""
+
+    key: str
+    translation_key: str
+    icon: str
+    min_val: float
+    max_val: float
+    step: float
+    # None for the profile factors, whose default comes from the room profile
+    default_val: float | None = None
+    unit: str | None = None
+    entity_category: EntityCategory | None = EntityCategory.CONFIG
+    clamp: Callable[[float], float] | None = None
+
+
+# Profile factor numbers, in ROOM_PROFILES data order [f_out, f_win, k_loss, k_solar]
+PROFILE_NUMBER_SPECS: tuple[NumberSpec, ...] = (
+    NumberSpec(
+        "f_out",
+        "exterior_envelope_ratio",
+        "mdi:wall",
+        0.0,
+        2.0,
+        0.01,
+        entity_category=None,
+    ),
+    NumberSpec(
+        "f_win",
+        "window_share",
+        "mdi:window-closed",
+        0.0,
+        1.0,
+        0.01,
+        entity_category=None,
+    ),
+    NumberSpec(
+        "k_loss",
+        "insulation_loss_factor",
+        "mdi:snowflake-thermometer",
+        0.0,
+        1.0,
+        0.01,
+        entity_category=None,
+    ),
+    NumberSpec(
+        "k_solar",
+        "solar_gain_factor",
+        "mdi:sun-wireless",
+        0.0,
+        2.0,
+        0.01,
+        entity_category=None,
+    ),
+)
+
+NUMBER_SPECS: tuple[NumberSpec, ...] = (
+    NumberSpec(
+        CONF_THERMAL_ALPHA,
+        "thermal_alpha",
+        "mdi:speedometer-slow",
+        0.05,
+        0.95,
+        0.01,
+        default_val=0.3,
+        clamp=_clamp_thermal_alpha,
+    ),
+    NumberSpec(
+        CONF_MANUAL_AIR_SPEED,
+        "manual_air_speed",
+        "mdi:tailwind",
+        0.0,
+        2.0,
+        0.1,
+        default_val=0.1,
+        unit="m/s",
+        clamp=_clamp_non_negative,
+    ),
+    NumberSpec(
+        CONF_HVAC_AIR_SPEED,
+        "hvac_air_speed",
+        "mdi:tailwind",
+        0.0,
+        2.0,
+        0.1,
+        default_val=0.4,
+        unit="m/s",
+        clamp=_clamp_non_negative,
+    ),
+    NumberSpec(
+        CONF_CLOTHING_INSULATION,
+        "clothing",
+        "mdi:hanger",
+        0.0,
+        3.0,
+        0.1,
+        default_val=0.6,
+        unit="clo",
+    ),
+    NumberSpec(
+        CONF_METABOLISM,
+        "metabolism",
+        "mdi:run",
+        0.8,
+        4.0,
+        0.1,
+        default_val=1.1,
+        unit="met",
+    ),
+)
+
+RADIANT_SURFACE_TEMP_SPEC = NumberSpec(
+    CONF_RADIANT_SURFACE_TEMP,
+    "radiant_surface_temp",
+    "mdi:thermometer-lines",
+    0.0,
+    85.0,
+    0.1,
+    default_val=26.0,
+    unit="°C",
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
@@ -41,102 +176,14 @@ async def async_setup_entry(
     # Get the default values from the selected profile
     profile_key = config[CONF_ROOM_PROFILE]
     defaults = ROOM_PROFILES[profile_key]["data"]  # [f_out, f_win, k_loss, k_solar]
-    device_info = await get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
-    entities: List[
-        VirtualNumber
-        | VirtualFactorNumber
-        | VirtualThermalAlphaNumber
-        | VirtualSurfaceTargetTempNumber
-        | VirtualAirSpeedNumber
-    ] = [
-        VirtualFactorNumber(
-            entry,
-            device_info,
-            "f_out",
-            "exterior_envelope_ratio",
-            "mdi:wall",
-            defaults[0],
-            0.0,
-            2.0,
-        ),
-        VirtualFactorNumber(
-            entry,
-            device_info,
-            "f_win",
-            "window_share",
-            "mdi:window-closed",
-            defaults[1],
-            0.0,
-            1.0,
-        ),
-        VirtualFactorNumber(
-            entry,
-            device_info,
-            "k_loss",
-            "insulation_loss_factor",
-            "mdi:snowflake-thermometer",
-            defaults[2],
-            0.0,
-            1.0,
-        ),
-        VirtualFactorNumber(
-            entry,
-            device_info,
-            "k_solar",
-            "solar_gain_factor",
-            "mdi:sun-wireless",
-            defaults[3],
-            0.0,
-            2.0,
-        ),
-        VirtualThermalAlphaNumber(
-            entry, device_info, CONF_THERMAL_ALPHA, "thermal_alpha", 0.3, 0.05, 0.95
-        ),
-        VirtualAirSpeedNumber(
-            entry, device_info, CONF_MANUAL_AIR_SPEED, "manual_air_speed", 0.1, 0.0, 2.0
-        ),
-        VirtualAirSpeedNumber(
-            entry, device_info, CONF_HVAC_AIR_SPEED, "hvac_air_speed", 0.4, 0.0, 2.0
-        ),
-        VirtualNumber(
-            entry,
-            device_info,
-            CONF_CLOTHING_INSULATION,
-            "clothing",
-            "mdi:hanger",
-            0.6,
-            0.0,
-            3.0,
-            0.1,
-            "clo",
-        ),
-        VirtualNumber(
-            entry,
-            device_info,
-            CONF_METABOLISM,
-            "metabolism",
-            "mdi:run",
-            1.1,
-            0.8,
-            4.0,
-            0.1,
-            "met",
-        ),
+    device_info = get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
+    entities: List[VirtualNumber] = [
+        VirtualNumber(entry, device_info, spec, default_val)
+        for spec, default_val in zip(PROFILE_NUMBER_SPECS, defaults)
     ]
+    entities.extend(VirtualNumber(entry, device_info, spec) for spec in NUMBER_SPECS)
     if config.get(CONF_IS_RADIANT, False):
-        (
-            entities.append(
-                VirtualSurfaceTargetTempNumber(
-                    entry,
-                    device_info,
-                    CONF_RADIANT_SURFACE_TEMP,
-                    "radiant_surface_temp",
-                    26.0,
-                    0.0,
-                    85.0,
-                )
-            ),
-        )
+        entities.append(VirtualNumber(entry, device_info, RADIANT_SURFACE_TEMP_SPEC))
     async_add_entities(entities)
 
 
@@ -151,170 +198,25 @@ class VirtualNumber(RestoreNumber):
         self,
         entry: ConfigEntry,
         device_info,
-        key: str,
-        translation_key: str,
-        icon: str,
-        default_val: float,
-        min_val: float,
-        max_val: float,
-        step: float,
-        unit: str | None = None,
-    ):
-        self._key = key
-        self._attr_unique_id = f"{entry.entry_id}_{key}"
-        self.translation_key = translation_key
-        self._attr_device_info = device_info
-        self._icon = icon
-
-        self._default_val = default_val
-        self._attr_native_min_value = min_val
-        self._attr_native_max_value = max_val
-        self._attr_native_step = step
-        self._attr_native_unit_of_measurement = unit
-        self._attr_native_value = default_val
-
-    @property
-    def icon(self) -> str | None:
-        return self._icon
-
-    async def async_added_to_hass(self) -> None:
-        """Restore last state."""
-        await super().async_added_to_hass()
-        last_data = await self.async_get_last_number_data()
-        if last_data is not None:
-            self._attr_native_value = last_data.native_value
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Update the value."""
-        self._attr_native_value = value
-        self.async_write_ha_state()
-
-
-class VirtualFactorNumber(RestoreNumber):
-    """A number entity that restores its value on restart."""
-
-    _attr_has_entity_name = True
-    _attr_mode = NumberMode.BOX
-
-    def __init__(
-        self,
-        entry: ConfigEntry,
-        device_info,
-        key,
-        translation_key,
-        icon,
-        default_val,
-        min_val,
-        max_val,
+        spec: NumberSpec,
+        default_val: float | None = None,
     ):
-        self._key = key
-        self._attr_unique_id = f"{entry.entry_id}_{key}"
-        self.translation_key = translation_key
+        self._attr_unique_id = f"{entry.entry_id}_{spec.key}"
+        self.translation_key = spec.translation_key
         self._attr_device_info = device_info
-        self._icon = icon
-
-        self._default_val = default_val
-        self._attr_native_min_value = min_val
-        self._attr_native_max_value = max_val
-        self._attr_native_step = 0.01
-        self._attr_native_value = default_val
-
-    @property
-    def icon(self) -> str | None:
-        return self._icon
-
-    @icon.setter
-    def icon(self, value):
-        self._icon = value
-
-    async def async_added_to_hass(self) -> None:
-        """Restore last state."""
-        await super().async_added_to_hass()
-        last_data = await self.async_get_last_number_data()
-        if last_data is not None:
-            self._attr_native_value = last_data.native_value
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Update the value."""
-        self._attr_native_value = value
-        self.async_write_ha_state()
-
-
-class VirtualThermalAlphaNumber(RestoreNumber):
-    """A number entity for setting the smoothing factor (alpha)."""
-
-    _attr_has_entity_name = True
-    _attr_mode = NumberMode.BOX
-    _attr_entity_category = EntityCategory.CONFIG
-    _attr_icon = "mdi:speedometer-slow"
-
-    def __init__(
-        self,
-        entry: ConfigEntry,
-        device_info,
-        key,
-        translation_key,
-        default_val,
-        min_val,
-        max_val,
-    ):
-        self._key = key
-        self._attr_unique_id = f"{entry.entry_id}_{key}"
-
-        self.translation_key = translation_key
-        self._attr_device_info = device_info
-
-        self._default_val = default_val
-        self._attr_native_min_value = min_val
-        self._attr_native_max_value = max_val
-        self._attr_native_step = 0.01
-        self._attr_native_value = default_val
-
-    async def async_added_to_hass(self) -> None:
-        """Restore last state."""
-        await super().async_added_to_hass()
-        last_data = await self.async_get_last_number_data()
-        if last_data is not None:
-            self._attr_native_value = last_data.native_value
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Update the value."""
-        # Clamp value to be sure, although the UI should prevent it
-        value = min(0.95, max(0.05, value))
-        self._attr_native_value = value
-        self.async_write_ha_state()
-
-
-class VirtualSurfaceTargetTempNumber(RestoreNumber):
-    """A number entity for setting surface target temperature in the local unit (default: °C)."""
-
-    _attr_has_entity_name = True
-    _attr_mode = NumberMode.BOX
-    _attr_entity_category = EntityCategory.CONFIG
-    _attr_icon = "mdi:thermometer-lines"
-    _attr_native_unit_of_measurement = "°C"
-
-    def __init__(
-        self,
-        entry: ConfigEntry,
-        device_info,
-        key,
-        translation_key,
-        default_val,
-        min_val,
-        max_val,
-    ):
-        self._key = key
-        self._attr_unique_id = f"{entry.entry_id}_{key}"
-
-        self.translation_key = translation_key
-        self._attr_device_info = device_info
-
-        self._default_val = default_val
-        self._attr_native_min_value = min_val
-        self._attr_native_max_value = max_val
-        self._attr_native_step = 0.1
-        self._attr_native_value = default_val
+        # Only the profile factors leave the class-wide CONFIG category
+        if spec.entity_category is not EntityCategory.CONFIG:
+            self._attr_entity_category = spec.entity_category
+        self._attr_icon = spec.icon
+        self._clamp = spec.clamp
+
+        self._attr_native_min_value = spec.min_val
+        self._attr_native_max_value = spec.max_val
+        self._attr_native_step = spec.step
+        self._attr_native_unit_of_measurement = spec.unit
+        self._attr_native_value = (
+            spec.default_val if default_val is None else default_val
+        )
 
     async def async_added_to_hass(self) -> None:
         """Restore last state."""
@@ -325,50 +227,7 @@ class VirtualSurfaceTargetTempNumber(RestoreNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the value."""
-        self._attr_native_value = value
-        self.async_write_ha_state()
-
-
-class VirtualAirSpeedNumber(RestoreNumber):
-    """A number entity for setting air speed (m/s)."""
-
-    _attr_has_entity_name = True
-    _attr_mode = NumberMode.BOX
-    _attr_entity_category = EntityCategory.CONFIG
-    _attr_icon = "mdi:tailwind"
-    _attr_native_unit_of_measurement = "m/s"
-
-    def __init__(
-        self,
-        entry: ConfigEntry,
-        device_info,
-        key,
-        translation_key,
-        default_val,
-        min_val,
-        max_val,
-    ):
-        self._key = key
-        self._attr_unique_id = f"{entry.entry_id}_{key}"
-
-        self.translation_key = translation_key
-        self._attr_device_info = device_info
-
-        self._default_val = default_val
-        self._attr_native_min_value = min_val
-        self._attr_native_max_value = max_val
-        self._attr_native_step = 0.1
-        self._attr_native_value = default_val
-
-    async def async_added_to_hass(self) -> None:
-        """Restore last state."""
-        await super().async_added_to_hass()
-        last_data = await self.async_get_last_number_data()
-        if last_data is not None:
-            self._attr_native_value = last_data.native_value
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Update the value, clamping to minimum of 0.0."""
-        value = max(0.0, value)
+        if self._clamp is not None:
+            value = self._clamp(value)
         self._attr_native_value = value
         self.async_write_ha_state()
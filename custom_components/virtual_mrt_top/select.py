@@ -1,6 +1,7 @@
 """Select platform for Virtual MRT."""
 
 from __future__ import annotations
+import asyncio
 import logging
 from typing import List
 
@@ -18,10 +19,9 @@ from homeassistant.helpers.entity import EntityCategory
 from .const import (
     DOMAIN,
     ROOM_PROFILES,
+    ROOM_PROFILE_KEYS,
     CUSTOM_PROFILE_KEY,
     CONF_ROOM_PROFILE,
-    STORAGE_KEY,
-    STORAGE_VERSION,
     STORE_KEY_CUSTOM,
     STORE_KEY_SAVED,
     CONF_CLIMATE_ENTITY,
@@ -31,6 +31,7 @@ from .const import (
     CONF_MANUAL_AIR_SPEED,
     CONF_RADIANT_TYPE,
     RADIANT_TYPES,
+    RADIANT_TYPE_KEYS,
     CONF_IS_RADIANT,
     CONF_DEVICE_TYPE,
     TYPE_AGGREGATOR,
@@ -39,6 +40,20 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait for further number changes before writing the custom profile
+CUSTOM_PROFILE_SAVE_DELAY = 2.0
+
+
+def _round_profile(values) -> tuple[float, ...]:
+    """Profile values rounded to 2 decimal places, for matching only."""
+    return tuple(round(v, 2) for v in values)
+
+
+# Built-in profile data rounded like the values read back from the numbers
+_ROUNDED_PRESETS: dict[str, tuple[float, ...]] = {
+    key: _round_profile(profile["data"]) for key, profile in ROOM_PROFILES.items()
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -47,9 +62,8 @@ async def async_setup_entry(
     config = entry.data
     if config.get(CONF_DEVICE_TYPE) == TYPE_AGGREGATOR:
         return
-    device_info = await get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
-    store_key = f"{STORAGE_KEY}_{entry.entry_id}"
-    store = Store(hass, STORAGE_VERSION, store_key)
+    device_info = get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
+    store: Store = hass.data[DOMAIN][entry.entry_id]
     entities: List[VirtualProfileSelect | VirtualRadiantTypeSelect] = [
         VirtualProfileSelect(hass, entry, device_info, store)
     ]
@@ -66,6 +80,8 @@ class VirtualRadiantTypeSelect(SelectEntity):
     _attr_icon = "mdi:radiator"
     translation_key = "radiant_type"
     _attr_entity_category = EntityCategory.CONFIG
+    # Options are the keys from the RADIANT_TYPES map, shared by all instances
+    _attr_options = list(RADIANT_TYPE_KEYS)
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry, device_info):
         self.hass = hass
@@ -73,18 +89,21 @@ class VirtualRadiantTypeSelect(SelectEntity):
         self._attr_unique_id = f"{entry.entry_id}_{CONF_RADIANT_TYPE}"
         self._attr_device_info = device_info
 
-        # Options are the keys from the RADIANT_TYPES map
-        self._attr_options = list(RADIANT_TYPES.keys())
-
         # Get initial state from config, defaulting to low_mass (fastest) if not set
         self._attr_current_option = entry.data.get(CONF_RADIANT_TYPE, "low_mass")
 
     async def async_select_option(self, option: str) -> None:
         """Handle selection and update the configuration entry."""
-        if option not in self._attr_options:
+        # The options are exactly the RADIANT_TYPES keys; check the dict itself
+        if option not in RADIANT_TYPES:
             _LOGGER.error("Invalid radiant type selected: %s", option)
             return
 
+        # Avoid rewriting the config entry (and notifying its listeners)
+        # when nothing changes
+        if option == self._attr_current_option:
+            return
+
         # 1. Update the internal state of the entity
         self._attr_current_option = option
         self.async_write_ha_state()
@@ -109,12 +128,14 @@ class VirtualProfileSelect(SelectEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_profile"
         self._attr_device_info = device_info
+        self._uid_prefix = entry.entry_id + "_"
 
         self._attr_current_option = entry.data[CONF_ROOM_PROFILE]
         self._store = store
 
-        self._attr_options = list(ROOM_PROFILES.keys()) + [CUSTOM_PROFILE_KEY]
+        self._attr_options = [*ROOM_PROFILE_KEYS, CUSTOM_PROFILE_KEY]
         self._saved_profiles: dict[str, list[float]] = {}
+        self._rounded_saved: dict[str, tuple[float, ...]] = {}
         self._custom_profile_data: list[float] | None = None
 
         # Entity IDs of the number inputs, to be found
@@ -130,6 +151,10 @@ class VirtualProfileSelect(SelectEntity):
         self.id_manual_speed = None
 
         self._is_updating = False
+        # Number values the change handler last acted on
+        self._last_values: tuple[float, ...] | None = None
+        # A delayed custom profile write is scheduled but not yet done
+        self._save_pending = False
 
     async def async_added_to_hass(self):
         """Find number entities and register listeners."""
@@ -138,38 +163,25 @@ class VirtualProfileSelect(SelectEntity):
         # Load all data from store and build options
         await self._load_data_and_build_options()
 
-        registry = er.async_get(self.hass)
-        self.id_f_out = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_f_out"
-        )
-        self.id_f_win = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_f_win"
-        )
-        self.id_k_loss = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_k_loss"
-        )
-        self.id_k_solar = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_k_solar"
-        )
+        get_entity_id = er.async_get(self.hass).async_get_entity_id
+        prefix = self._uid_prefix
+        self.id_f_out = get_entity_id("number", DOMAIN, prefix + "f_out")
+        self.id_f_win = get_entity_id("number", DOMAIN, prefix + "f_win")
+        self.id_k_loss = get_entity_id("number", DOMAIN, prefix + "k_loss")
+        self.id_k_solar = get_entity_id("number", DOMAIN, prefix + "k_solar")
 
-        self.id_climate = registry.async_get_entity_id(
-            Platform.CLIMATE, DOMAIN, f"{self._entry.entry_id}_{CONF_CLIMATE_ENTITY}"
+        self.id_climate = get_entity_id(
+            Platform.CLIMATE, DOMAIN, prefix + CONF_CLIMATE_ENTITY
         )
-        self.id_fan = registry.async_get_entity_id(
-            Platform.FAN, DOMAIN, f"{self._entry.entry_id}_{CONF_FAN_ENTITY}"
+        self.id_fan = get_entity_id(Platform.FAN, DOMAIN, prefix + CONF_FAN_ENTITY)
+        self.id_window = get_entity_id(
+            Platform.BINARY_SENSOR, DOMAIN, prefix + CONF_WINDOW_STATE_SENSOR
         )
-        self.id_window = registry.async_get_entity_id(
-            Platform.BINARY_SENSOR,
-            DOMAIN,
-            f"{self._entry.entry_id}_{CONF_WINDOW_STATE_SENSOR}",
+        self.id_door = get_entity_id(
+            Platform.BINARY_SENSOR, DOMAIN, prefix + CONF_DOOR_STATE_SENSOR
         )
-        self.id_door = registry.async_get_entity_id(
-            Platform.BINARY_SENSOR,
-            DOMAIN,
-            f"{self._entry.entry_id}_{CONF_DOOR_STATE_SENSOR}",
-        )
-        self.id_manual_speed = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_{CONF_MANUAL_AIR_SPEED}"
+        self.id_manual_speed = get_entity_id(
+            "number", DOMAIN, prefix + CONF_MANUAL_AIR_SPEED
         )
 
         number_entities = [
@@ -190,19 +202,27 @@ class VirtualProfileSelect(SelectEntity):
             )
         )
 
-    async def _get_current_number_values(self) -> list[float] | None:
-        """Helper to safely read current values from number entities."""
+    async def async_will_remove_from_hass(self) -> None:
+        """Flush a pending custom profile write before the store is dropped."""
+        # Otherwise the delayed write can land after the entry is removed and
+        # recreate its deleted profile file; async_save cancels the delay
+        if self._save_pending:
+            await self._store.async_save(self._build_store_payload())
+
+    @callback
+    def _read_number_values(self) -> tuple[float, float, float, float] | None:
+        """Current profile number values, or None if any state is unusable."""
+        # We read states directly since we are not in the main update loop.
+        # The values are raw; callers round them (_round_profile) to compare
+        # against the stored data/presets.
+        states_get = self.hass.states.get
         try:
-            # We read states directly since we are not in the main update loop.
-            values = [
-                float(self.hass.states.get(self.id_f_out).state),
-                float(self.hass.states.get(self.id_f_win).state),
-                float(self.hass.states.get(self.id_k_loss).state),
-                float(self.hass.states.get(self.id_k_solar).state),
-            ]
-            # Rounding to 2 decimal places to match the stored data/presets,
-            # ensuring accurate comparison.
-            return [round(v, 2) for v in values]
+            return (
+                float(states_get(self.id_f_out).state),
+                float(states_get(self.id_f_win).state),
+                float(states_get(self.id_k_loss).state),
+                float(states_get(self.id_k_solar).state),
+            )
         except (AttributeError, ValueError):
             return None
 
@@ -218,16 +238,19 @@ class VirtualProfileSelect(SelectEntity):
 
         self._custom_profile_data = data.get(STORE_KEY_CUSTOM)
         self._saved_profiles = data.get(STORE_KEY_SAVED, {})
+        self._rounded_saved = {
+            key: _round_profile(values) for key, values in self._saved_profiles.items()
+        }
 
         if migrated:
             await self._store.async_save(data)  # Save the new structure
 
         # Dynamically build the options list
-        self._attr_options = (
-            list(ROOM_PROFILES.keys())
-            + list(self._saved_profiles.keys())
-            + [CUSTOM_PROFILE_KEY]
-        )
+        self._attr_options = [
+            *ROOM_PROFILE_KEYS,
+            *self._saved_profiles,
+            CUSTOM_PROFILE_KEY,
+        ]
         _LOGGER.debug("Rebuilt profile options list")
 
     @callback
@@ -236,67 +259,76 @@ class VirtualProfileSelect(SelectEntity):
         if self._is_updating:
             return
 
-        try:
-            current_values = [
-                float(self.hass.states.get(self.id_f_out).state),
-                float(self.hass.states.get(self.id_f_win).state),
-                float(self.hass.states.get(self.id_k_loss).state),
-                float(self.hass.states.get(self.id_k_solar).state),
-            ]
-        except (AttributeError, ValueError):
+        current_values = self._read_number_values()
+        if current_values is None:
             _LOGGER.debug("Number entity state not ready during check")
             return
 
-        # Check if current values match the selected profile
-        current_profile_data: list[float] | None = None
-        if self._attr_current_option in ROOM_PROFILES:
-            current_profile_data = ROOM_PROFILES[self._attr_current_option]["data"]
-        elif self._attr_current_option in self._saved_profiles:
-            current_profile_data = self._saved_profiles[self._attr_current_option]
-        elif self._attr_current_option == CUSTOM_PROFILE_KEY:
-            current_profile_data = self._custom_profile_data
+        # Other attribute changes or same-value writes need no new match
+        if current_values == self._last_values:
+            return
+        self._last_values = current_values
+
+        # Check if current values match the selected profile; named profiles
+        # match on rounded values, the custom one is kept at full precision
+        current_option = self._attr_current_option
+        if current_option in _ROUNDED_PRESETS:
+            matches = _round_profile(current_values) == _ROUNDED_PRESETS[current_option]
+        elif current_option in self._rounded_saved:
+            matches = (
+                _round_profile(current_values) == self._rounded_saved[current_option]
+            )
+        elif current_option == CUSTOM_PROFILE_KEY and self._custom_profile_data:
+            matches = list(current_values) == self._custom_profile_data
+        else:
+            matches = False
 
         # If values don't match, or we have no profile, switch to Custom
-        if current_values != current_profile_data:
+        if not matches:
             _LOGGER.debug("Numbers changed, saving to 'custom' and switching profile")
-            self._custom_profile_data = current_values
+            self._custom_profile_data = list(current_values)
 
-            # Save the new "custom" data to the store
-            self.hass.async_create_task(self._save_custom_profile())
+            # Save the new "custom" data to the store; a slider drag only
+            # writes the value it settles on
+            self._save_pending = True
+            self._store.async_delay_save(
+                self._build_store_payload, CUSTOM_PROFILE_SAVE_DELAY
+            )
 
             self._attr_current_option = CUSTOM_PROFILE_KEY
             self.async_write_ha_state()
 
-    async def _save_custom_profile(self) -> None:
-        """Save just the 'custom' key to the store."""
-        data = await self._store.async_load() or {}
-        data[STORE_KEY_CUSTOM] = self._custom_profile_data
-        await self._store.async_save(data)
-        _LOGGER.debug("Updated stored 'custom' profile")
+    @callback
+    def _build_store_payload(self) -> dict:
+        """Store contents: the 'custom' profile along with the saved profiles."""
+        # _saved_profiles mirrors the store since the last options (re)load,
+        # so there is no need to read the file back first
+        self._save_pending = False
+        return {
+            STORE_KEY_CUSTOM: self._custom_profile_data,
+            STORE_KEY_SAVED: self._saved_profiles,
+        }
 
     async def async_find_matching_profile(self) -> str:
         """
         Compares current number entity states against all ROOM_PROFILES
         and returns the key of the matching profile, or CUSTOM_PROFILE_KEY if none match.
         """
-        current_values = await self._get_current_number_values()
+        current = self._read_number_values()
 
-        if not current_values:
+        if current is None:
             # If we can't read the current state, default to Custom as we don't know the state
             return CUSTOM_PROFILE_KEY
+        current = _round_profile(current)
 
         # Check against all static profiles
-        for key, profile in ROOM_PROFILES.items():
-            preset_data = [round(v, 2) for v in profile["data"]]
-
-            # Using == for comparison since both lists are lists of floats
-            if current_values == preset_data:
+        for key, preset_data in _ROUNDED_PRESETS.items():
+            if current == preset_data:
                 return key
 
         # Check against the saved custom profiles (if needed, though post-delete is mainly about defaults)
-        for key, values in self._saved_profiles.items():
-            saved_data = [round(v, 2) for v in values]
-            if current_values == saved_data:
+        for key, saved_data in self._rounded_saved.items():
+            if current == saved_data:
                 return key
 
         return CUSTOM_PROFILE_KEY
@@ -324,34 +356,22 @@ class VirtualProfileSelect(SelectEntity):
             _LOGGER.error("Selected profile '%s' not found", option)
             return
 
+        # Re-selecting the active profile while the numbers still hold it
+        # has nothing to apply
+        if (
+            preset_data
+            and option == self._attr_current_option
+            and (current := self._read_number_values()) is not None
+            and _round_profile(current) == _round_profile(preset_data)
+        ):
+            return
+
         self._is_updating = True
+        # The numbers are about to change behind the change handler's back
+        self._last_values = None
 
         if preset_data:
-            # Set all number entities to the selected profile's values
-            await self.hass.services.async_call(
-                "number",
-                SERVICE_SET_VALUE,
-                {"entity_id": self.id_f_out, "value": preset_data[0]},
-                blocking=True,
-            )
-            await self.hass.services.async_call(
-                "number",
-                SERVICE_SET_VALUE,
-                {"entity_id": self.id_f_win, "value": preset_data[1]},
-                blocking=True,
-            )
-            await self.hass.services.async_call(
-                "number",
-                SERVICE_SET_VALUE,
-                {"entity_id": self.id_k_loss, "value": preset_data[2]},
-                blocking=True,
-            )
-            await self.hass.services.async_call(
-                "number",
-                SERVICE_SET_VALUE,
-                {"entity_id": self.id_k_solar, "value": preset_data[3]},
-                blocking=True,
-            )
+            await self._async_set_number_values(preset_data)
 
         # Update our own state to the newly selected option
         self._attr_current_option = option
@@ -359,6 +379,34 @@ class VirtualProfileSelect(SelectEntity):
 
         self._is_updating = False
 
+    async def _async_set_number_values(self, values: list[float]) -> None:
+        """Set the four profile number entities to ``values``."""
+        entity_ids = (self.id_f_out, self.id_f_win, self.id_k_loss, self.id_k_solar)
+
+        # The numbers live in this integration, so set them on the entity
+        # objects directly instead of dispatching number.set_value
+        component = self.hass.data.get("number")
+        if component is not None:
+            entities = [component.get_entity(entity_id) for entity_id in entity_ids]
+            if all(entities):
+                for entity, value in zip(entities, values):
+                    await entity.async_set_native_value(value)
+                return
+
+        # Entity objects not reachable; they are independent entities, so the
+        # service calls can run concurrently
+        await asyncio.gather(
+            *(
+                self.hass.services.async_call(
+                    "number",
+                    SERVICE_SET_VALUE,
+                    {"entity_id": entity_id, "value": value},
+                    blocking=True,
+                )
+                for entity_id, value in zip(entity_ids, values)
+            )
+        )
+
     async def async_update_options_and_select(self, new_option_name: str) -> None:
         """
         Called by button entities to refresh the options list
@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 import math
 import time
+from collections import ChainMap
+from functools import lru_cache
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -19,9 +21,9 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event, async_call_later
 
-from . import CONF_IS_RADIANT
 from .const import (
     DOMAIN,
+    CONF_IS_RADIANT,
     CONF_AIR_TEMP_SOURCE,
     CONF_WEATHER_ENTITY,
     CONF_ROOM_PROFILE,
@@ -44,7 +46,7 @@ from .const import (
     RADIANT_TYPES,
     CONF_RADIANT_SURFACE_TEMP,
     CONF_RADIANT_TYPE,
-    ORIENTATION_DEGREES,
+    ORIENTATION_RADIANS,
     CONF_RH_SENSOR,
     CONF_WALL_SURFACE_SENSOR,
     CONF_WIND_SPEED_SENSOR,
@@ -72,738 +74,49 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# States that carry no usable reading
+UNUSABLE_STATES = frozenset({"unknown", "unavailable"})
 
-async def async_setup_entry(
-    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
-):
-    """Set up sensors from a config entry."""
-    config = entry.data
-    device_type = config.get(
-        CONF_DEVICE_TYPE, "room"
-    )  # Default to room for old configs
-    device_info = await get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
-
-    # --- BRANCH 1: AGGREGATOR ---
-    if device_type == TYPE_AGGREGATOR:
-        async_add_entities([VirtualZoneAggregator(hass, entry, device_info)])
-        return
-    # --- BRANCH 2: ROOM SENSOR SET ---
-    mrt_sensor = VirtualMRTSensor(hass, entry, device_info)
-    op_sensor = VirtualOperativeTempSensor(hass, entry, device_info, mrt_sensor)
-    entities = [mrt_sensor, op_sensor]
-    if config.get(CONF_RH_SENSOR):
-        entities.extend(
-            [
-                VirtualDewPointSensor(hass, entry, device_info),
-                VirtualFrostPointSensor(hass, entry, device_info),
-                VirtualAbsoluteHumiditySensor(hass, entry, device_info),
-                VirtualEnthalpySensor(hass, entry, device_info),
-                VirtualHumidexSensor(hass, entry, device_info),
-                VirtualPerceptionSensor(hass, entry, device_info),
-                VirtualMoldRiskSensor(hass, entry, device_info),
-                VirtualHeatFluxSensor(hass, entry, device_info, mrt_sensor),
-                VirtualPMVSensor(hass, entry, device_info, mrt_sensor),
-                VirtualMoistureExcessSensor(hass, entry, device_info),
-            ]
-        )
-    if config.get(CONF_WALL_SURFACE_SENSOR):
-        entities.append(VirtualCalibrationSensor(hass, entry, device_info))
-    async_add_entities(entities)
-
-
-class VirtualMRTSensorOLD(SensorEntity):
-    """Calculates Mean Radiant Temperature."""
-
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_suggested_display_precision = 2
-
-    translation_key = "mrt"
-
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, device_info):
-        self.hass = hass
-        self._entry = entry
-        self._config = entry.data
-
-        self._attr_unique_id = f"{entry.entry_id}_mrt"
-        self._attr_device_info = device_info
-
-        # Inputs
-        self.entity_air = self._config[CONF_AIR_TEMP_SOURCE]
-        self.entity_weather = self._config[CONF_WEATHER_ENTITY]
-        self.entity_solar = self._config.get(CONF_SOLAR_SENSOR)
-        self.entity_climate = self._config.get(CONF_CLIMATE_ENTITY)
-        self.entity_fan = self._config.get(CONF_FAN_ENTITY)
-        self.entity_window = self._config.get(CONF_WINDOW_STATE_SENSOR)
-        self.entity_door = self._config.get(CONF_DOOR_STATE_SENSOR)
-        self.entity_shading = self._config.get(CONF_SHADING_ENTITY)
-        self.entity_wall_sensor = self._config.get(CONF_WALL_SURFACE_SENSOR)
-        self.entity_outdoor_temp = self._config.get(CONF_OUTDOOR_TEMP_SENSOR)
-        self.entity_outdoor_hum = self._config.get(CONF_OUTDOOR_HUMIDITY_SENSOR)
-        self.entity_wind_speed = self._config.get(CONF_WIND_SPEED_SENSOR)
-        self.entity_rain = self._config.get(CONF_PRECIPITATION_SENSOR)
-        self.entity_uv = self._config.get(CONF_UV_INDEX_SENSOR)
-        orient_code = self._config[CONF_ORIENTATION]
-        self.orientation_degrees = ORIENTATION_DEGREES.get(orient_code, 180)
-        self._radiant_boost_stored = 0.0
-        self.is_radiant = self._config.get(CONF_IS_RADIANT, False)
-
-        self._attr_native_value = None
-        self._mrt_prev = None
-        self._attributes = {}
-        self._last_update_time = 0.0
-        self._min_update_interval = 60.0  # Seconds
-
-        # Entity IDs of the number inputs, to be found
-        self.id_f_out = None
-        self.id_f_win = None
-        self.id_k_loss = None
-        self.id_k_solar = None
-        self.id_profile_select = None
-        self.id_thermal_alpha = None
-        self.id_manual_speed = None
-        self.id_hvac_speed = None
-        self.id_radiant_type = None
-        self.id_radiant_temp = None
-
-        self._min_update_interval = self._config.get(CONF_MIN_UPDATE_INTERVAL, 30.0)
-        self._last_update_time = 0.0
-        self._cancel_scheduled_update = None
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return self._attributes
-
-    async def async_added_to_hass(self):
-        """Find number entities and register listeners."""
-        await super().async_added_to_hass()
-
-        # Find the entity IDs of the number controls
-        registry = er.async_get(self.hass)
-        self.id_f_out = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_f_out"
-        )
-        self.id_f_win = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_f_win"
-        )
-        self.id_k_loss = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_k_loss"
-        )
-        self.id_k_solar = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_k_solar"
-        )
-        self.id_profile_select = registry.async_get_entity_id(
-            "select", DOMAIN, f"{self._entry.entry_id}_profile"
-        )
-        self.id_thermal_alpha = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_{CONF_THERMAL_ALPHA}"
-        )
-        self.id_manual_speed = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_{CONF_MANUAL_AIR_SPEED}"
-        )
-        self.id_hvac_speed = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_{CONF_HVAC_AIR_SPEED}"
-        )
-        self.id_radiant_temp = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_{CONF_RADIANT_SURFACE_TEMP}"
-        )
-        self.id_radiant_type = registry.async_get_entity_id(
-            "select", DOMAIN, f"{self._entry.entry_id}_{CONF_RADIANT_TYPE}"
-        )
-
-        # Core entities to listen to
-        entities_to_track = [self.entity_air, self.entity_weather, "sun.sun"]
-
-        # Add optional entity IDs (only if configured)
-        if self.entity_wall_sensor:
-            entities_to_track.append(self.entity_wall_sensor)
-        if self.entity_solar:
-            entities_to_track.append(self.entity_solar)
-        if self.entity_climate:
-            entities_to_track.append(self.entity_climate)
-        if self.entity_fan:
-            entities_to_track.append(self.entity_fan)
-        if self.entity_window:
-            entities_to_track.append(self.entity_window)
-        if self.entity_door:
-            entities_to_track.append(self.entity_door)
-        if self.entity_shading:
-            entities_to_track.append(self.entity_shading)
-        if self.entity_outdoor_temp:
-            entities_to_track.append(self.entity_outdoor_temp)
-        if self.entity_outdoor_hum:
-            entities_to_track.append(self.entity_outdoor_hum)
-        if self.entity_wind_speed:
-            entities_to_track.append(self.entity_wind_speed)
-        if self.entity_rain:
-            entities_to_track.append(self.entity_rain)
-        if self.entity_uv:
-            entities_to_track.append(self.entity_uv)
-
-        # Add number entities (if found)
-        for num_id in [
-            self.id_f_out,
-            self.id_f_win,
-            self.id_k_loss,
-            self.id_k_solar,
-            self.id_thermal_alpha,
-            self.id_manual_speed,
-            self.id_hvac_speed,
-            self.id_radiant_temp,
-        ]:
-            if num_id:
-                entities_to_track.append(num_id)
-
-        # Add select entity (if found)
-        if self.id_profile_select:
-            entities_to_track.append(self.id_profile_select)
-        if self.id_radiant_type:
-            entities_to_track.append(self.id_radiant_type)
-
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, entities_to_track, self._handle_update
-            )
-        )
-        self._update_calc()  # Initial update
-
-    @property
-    def icon(self) -> str | None:
-        """Icon of the entity"""
-        return "mdi:home-thermometer"
-
-    @callback
-    def _handle_update(self, event):
-        """Handle entity state changes with Rate Limiting."""
-        now = time.time()
-        time_since = now - self._last_update_time
-
-        # 1. If interval is 0, update instantly (No throttle)
-        if self._min_update_interval <= 0:
-            self._perform_update()
-            return
-
-        # 2. If enough time has passed, update immediately
-        if time_since >= self._min_update_interval:
-            self._perform_update()
-        else:
-            # 3. If too soon, schedule an update for the end of the interval
-            # We cancel any existing timer so we don't stack updates
-            if self._cancel_scheduled_update:
-                self._cancel_scheduled_update()
-                self._cancel_scheduled_update = None
-
-            delay = self._min_update_interval - time_since
-            self._cancel_scheduled_update = async_call_later(
-                self.hass, delay, self._scheduled_update_callback
-            )
-
-    @callback
-    def _scheduled_update_callback(self, _):
-        """Called when the rate-limit timer expires."""
-        self._cancel_scheduled_update = None
-        self._perform_update()
-
-    def _perform_update(self):
-        """Actually run the calc and write state."""
-        self._last_update_time = time.time()
-        self._update_calc()
-        self.async_write_ha_state()
-
-    def _get_float(self, entity_id, default=0.0):
-        """Helper to get float from state."""
-        if not entity_id:
-            return default
-        state = self.hass.states.get(entity_id)
-        if not state or state.state in ["unknown", "unavailable"]:
-            return default
-        try:
-            return float(state.state)
-        except ValueError:
-            return default
-
-    def _get_attr(self, entity_id, attr, default=None):
-        """Helper to get attribute."""
-        state = self.hass.states.get(entity_id)
-        if not state:
-            return default
-        val = state.attributes.get(attr)
-        try:
-            return float(val) if val is not None else default
-        except ValueError:
-            return default
-
-    def _get_solar_incidence_factor(self) -> float:
-        """Calculates how directly the sun is shining on the window."""
-        sun_state = self.hass.states.get("sun.sun")
-        if not sun_state:
-            return 0.1  # Fallback to diffuse only
-
-        sun_azimuth = sun_state.attributes.get("azimuth", 180)
-
-        # Calculate difference between Sun and Window
-        diff = abs(sun_azimuth - self.orientation_degrees)
-        if diff > 180:
-            diff = 360 - diff
-
-        # If the sun is more than 90 degrees off-axis, only diffuse (skylight).
-        if diff >= 90:
-            return 0.1
-
-        # Calculate cosine of the angle
-        cosine_factor = math.cos(math.radians(diff))
-
-        # Result is Cosine + Diffuse Baseline (clamped to 1.0 max)
-        return min(1.0, cosine_factor + 0.1)
-
-    def _get_shading_factor(self) -> float:
-        """Calculates solar multiplier based on entity state (0.0 to 1.0)."""
-        if not self.entity_shading:
-            return 1.0
-
-        state_obj = self.hass.states.get(self.entity_shading)
-        if not state_obj or state_obj.state in ["unavailable", "unknown", None]:
-            return 1.0
-
-        domain = state_obj.domain
-        state = state_obj.state
-
-        # --- CASE 1: COVERS ---
-        if domain == "cover":
-            current_pos = state_obj.attributes.get("current_position")
-            if current_pos is not None:
-                try:
-                    return float(current_pos) / 100.0
-                except ValueError:
-                    pass
-            return 0.0 if state == "closed" else 1.0
-
-        # --- CASE 2: NUMBERS / SENSORS ---
-        if domain in ["input_number", "sensor", "number"]:
-            try:
-                val = float(state)
-                if val > 1.0:
-                    return min(1.0, val / 100.0)
-                return max(0.0, val)
-            except ValueError:
-                return 1.0
-
-        # --- CASE 3: BINARY ---
-        if state == "on":
-            return 1.0
-        if state == "off":
-            return 0.0
-
-        return 1.0
-
-    def _calculate_v_air(self) -> float:
-        """Determines the effective air velocity (m/s) based on priority logic."""
-        # Note: This function assumes IDs are valid or None.
-
-        # Read new entity states
-        climate_state = (
-            self.hass.states.get(self.entity_climate) if self.entity_climate else None
-        )
-        window_state = (
-            self.hass.states.get(self.entity_window) if self.entity_window else None
-        )
-        door_state = (
-            self.hass.states.get(self.entity_door) if self.entity_door else None
-        )
-        fan_state = self.hass.states.get(self.entity_fan) if self.entity_fan else None
-
-        # Start with default still air speed
-        potential_speeds = [DEFAULT_AIR_SPEED_STILL]
-
-        # --- Check Manual Override ---
-        manual_speed = self._get_float(self.id_manual_speed, 0.0)
-        if manual_speed > 0:
-            potential_speeds.append(manual_speed)
-
-        # --- Check Natural Ventilation ---
-        if window_state and window_state.state.lower() == "on":
-            potential_speeds.append(DEFAULT_AIR_SPEED_WINDOW)
-
-        if door_state and door_state.state.lower() == "on":
-            potential_speeds.append(DEFAULT_AIR_SPEED_DOOR)
-
-        # --- Check HVAC (Forced Air) ---
-        hvac_speed_setting = self._get_float(self.id_hvac_speed, DEFAULT_AIR_SPEED_HVAC)
-        if not self.is_radiant:
-            if climate_state:
-                attrs = climate_state.attributes
-                is_active = attrs.get("hvac_action") not in ["off", "idle", None]
-                is_fan_forced = attrs.get("fan_mode") == "on"
-
-                if is_active or is_fan_forced:
-                    potential_speeds.append(hvac_speed_setting)
-
-        # --- Check Local Fan Entity ---
-        if fan_state and fan_state.state not in ["off", "unavailable", "unknown", None]:
-            fan_speed_key = str(fan_state.state).lower()
-            fan_speed = FAN_SPEED_MAP.get(fan_speed_key, hvac_speed_setting)
-            potential_speeds.append(fan_speed)
-
-        return max(potential_speeds)
-
-    def _calculate_local_apparent_temp(
-        self, t_out: float, wind_ms: float
-    ) -> float | None:
-        """
-        Calculates Apparent Temperature (AAT) using local sensors.
-        Formula covers both Wind Chill and Humidity effects.
-        AT = Ta + 0.33*e - 0.70*ws - 4.00
-        """
-        # 1. Get Outdoor Humidity (Local > Weather > Fail)
-        rh_out = self._get_float(self.entity_outdoor_hum, None)
-        if rh_out is None:
-            w_state = self.hass.states.get(self.entity_weather)
-            if w_state:
-                rh_out = w_state.attributes.get("humidity")
-
-        if rh_out is None:
-            return None  # Cannot calculate without humidity
-
-        # 2. Calculate Vapor Pressure (hPa)
-        # Use the static helper from Psychrometrics
-        vp_sat = Psychrometrics.calculate_vapor_pressure(t_out)
-        vp_actual = vp_sat * (rh_out / 100.0)
-
-        # 3. Apply AAT Formula
-        # Note: wind_ms is raw here; in strict meteorology it's avg'd, but raw is fine.
-        app_temp = t_out + (0.33 * vp_actual) - (0.70 * wind_ms) - 4.00
-
-        return app_temp
-
-    def _update_calc(self):
-        """Perform the math and store all intermediate values."""
-
-        # --- 1. ROBUST ENTITY CHECK ---
-        # We must verify that ALL required internal entity IDs have been found
-        # before we attempt to read their states.
-        required_ids = [
-            self.id_f_out,
-            self.id_f_win,
-            self.id_k_loss,
-            self.id_k_solar,
-            self.id_profile_select,
-            self.id_thermal_alpha,
-            self.id_manual_speed,
-            self.id_hvac_speed,
-            self.id_radiant_temp,
-            self.id_radiant_type,
-        ]
-
-        if not all(required_ids):
-            _LOGGER.debug("Entities not yet registered, trying to find them...")
-            registry = er.async_get(self.hass)
-
-            # Try to populate missing IDs
-            if not self.id_f_out:
-                self.id_f_out = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_f_out"
-                )
-            if not self.id_f_win:
-                self.id_f_win = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_f_win"
-                )
-            if not self.id_k_loss:
-                self.id_k_loss = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_k_loss"
-                )
-            if not self.id_k_solar:
-                self.id_k_solar = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_k_solar"
-                )
-            if not self.id_profile_select:
-                self.id_profile_select = registry.async_get_entity_id(
-                    "select", DOMAIN, f"{self._entry.entry_id}_profile"
-                )
-            if not self.id_thermal_alpha:
-                self.id_thermal_alpha = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_{CONF_THERMAL_ALPHA}"
-                )
-            if not self.id_manual_speed:
-                self.id_manual_speed = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_{CONF_MANUAL_AIR_SPEED}"
-                )
-            if not self.id_hvac_speed:
-                self.id_hvac_speed = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_{CONF_HVAC_AIR_SPEED}"
-                )
-            if not self.id_radiant_temp:
-                self.id_radiant_temp = registry.async_get_entity_id(
-                    "number",
-                    DOMAIN,
-                    f"{self._entry.entry_id}_{CONF_RADIANT_SURFACE_TEMP}",
-                )
-            if not self.id_radiant_type:
-                self.id_radiant_type = registry.async_get_entity_id(
-                    "select", DOMAIN, f"{self._entry.entry_id}_{CONF_RADIANT_TYPE}"
-                )
-
-            # Re-check. If still missing, we cannot proceed.
-            # We must use 'self.id_xxx' here to check the instance variables.
-            if not (
-                self.id_f_out
-                and self.id_f_win
-                and self.id_k_loss
-                and self.id_k_solar
-                and self.id_profile_select
-                and self.id_thermal_alpha
-                and self.id_manual_speed
-                and self.id_hvac_speed
-                and self.id_radiant_temp
-                and self.id_radiant_type
-            ):
-                _LOGGER.debug(
-                    "Could not find all required entities for %s, calculation will be delayed.",
-                    self.entity_id,
-                )
-                return
-
-        # --- Start fresh on attributes
-        self._attributes = {}
-
-        # --- Calculate Air Speed (v_air) ---
-        v_air = self._calculate_v_air()
-        self._attributes["air_speed_ms_convective"] = round(v_air, 2)
-
-        # --- Profile Info ---
-        profile_key = self._config[CONF_ROOM_PROFILE]
-        if self.id_profile_select:
-            profile_state = self.hass.states.get(self.id_profile_select)
-            if profile_state and profile_state.state not in ["unknown", "unavailable"]:
-                profile_key = profile_state.state
-        self._attributes["profile"] = profile_key
-        self._attributes["orientation"] = self._config[CONF_ORIENTATION]
-
-        # --- T_air (Input) ---
-        t_air = self._get_float(self.entity_air, None)
-        if t_air is None:
-            return
-        self._attributes["t_air"] = t_air
-
-        # --- T_out (Input) ---
-        t_out = self._get_float(self.entity_outdoor_temp, None)
-        if t_out is None:
-            t_out = self._get_attr(self.entity_weather, "temperature")
-        if t_out is None:
-            # If we have absolutely no data, we can't run the physics model safely.
-            return
-
-        # --- Wind (Input) ---
-        wind_speed_ms = self._get_float(self.entity_wind_speed, None)
-        if wind_speed_ms is None:
-            wind_speed_ms = self._get_attr(self.entity_weather, "wind_speed", 0.0)
-        weather_state_obj = self.hass.states.get(self.entity_weather)
-        if (
-            weather_state_obj
-            and weather_state_obj.attributes.get("wind_speed_unit") == "km/h"
-        ):
-            wind_speed_ms = wind_speed_ms / 3.6
-        wind_speed_kmh = wind_speed_ms * 3.6
-        self._attributes["wind_ms"] = round(wind_speed_ms, 2)
-        self._attributes["wind_kmh"] = round(wind_speed_kmh, 2)
-        self._attributes["wind_source"] = "weather_entity"
-
-        # We want the "Feels Like" temp because that drives heat loss better than dry bulb.
-        # Try to calculate locally first (Most Accurate)
-        t_app = self._calculate_local_apparent_temp(t_out, wind_speed_ms)
-        t_out_source = "calculated_local_aat"
-
-        if t_app is None:
-            # Fallback to weather entity attribute
-            t_app = self._get_attr(self.entity_weather, "apparent_temperature")
-            t_out_source = "weather_entity_attr"
-
-        # Use the lower of the two (Conservative for heating: Wind Chill matters)
-        # If T_app is missing, just use T_out
-        if t_app is not None and t_app < t_out:
-            t_out_eff = t_app
-        else:
-            t_out_eff = t_out
-            t_out_source = "dry_bulb_clamped"
-
-        self._attributes["t_out_eff"] = round(t_out_eff, 2)
-        self._attributes["t_out_eff_source"] = t_out_source
-
-        # --- Dynamic Factors (Inputs) ---
-        config_profile_key = self._config[CONF_ROOM_PROFILE]
-        defaults = ROOM_PROFILES[config_profile_key]["data"]
-        f_out = self._get_float(self.id_f_out, defaults[0])
-        f_win = self._get_float(self.id_f_win, defaults[1])
-        k_loss = self._get_float(self.id_k_loss, defaults[2])
-        k_solar = self._get_float(self.id_k_solar, defaults[3])
-        alpha = self._get_float(self.id_thermal_alpha, 0.3)
-        self._attributes["factor_f_out"] = f_out
-        self._attributes["factor_f_win"] = f_win
-        self._attributes["factor_k_loss"] = k_loss
-        self._attributes["factor_k_solar"] = k_solar
-        self._attributes["thermal_alpha"] = alpha
-
-        # --- Clouds/UV/Rain (Inputs) ---
-        cloud = self._get_attr(self.entity_weather, "cloud_coverage", None)
-        cloud_source = "weather_entity"
-        if cloud is None:
-            cloud = 50.0
-            cloud_source = "fallback"
-        self._attributes["cloud_coverage"] = cloud
-        self._attributes["cloud_source"] = cloud_source
-        # --- UV Logic ---
-        uv = None
-        uv_source = "fallback"
-
-        # 1. Try Dedicated Sensor
-        if self.entity_uv:
-            uv = self._get_float(self.entity_uv, None)
-            if uv is not None:
-                uv_source = "sensor"
-
-        # 2. Try Weather Entity
-        if uv is None:
-            uv = self._get_attr(self.entity_weather, "uv_index", None)
-            if uv is not None:
-                uv_source = "weather_entity"
-
-        # 3. Fallback
-        if uv is None:
-            uv = 0.0
-
-        self._attributes["uv_index"] = uv
-        self._attributes["uv_source"] = uv_source
-
-        # --- RAIN LOGIC ---
-        is_raining = False
-        rain_source = "unknown"
-
-        # 1. Try Dedicated Sensor (Rate > 0)
-        if self.entity_rain:
-            rain_rate = self._get_float(self.entity_rain, None)
-            if rain_rate is not None:
-                is_raining = rain_rate > 0.0
-                rain_source = "sensor"
-
-        # 2. Try Weather Entity State (String match)
-        if rain_source == "unknown":
-            weather_state_obj = self.hass.states.get(self.entity_weather)
-            cond = weather_state_obj.state.lower() if weather_state_obj else ""
-            is_raining = any(x in cond for x in ["rain", "pour", "snow", "hail"])
-            rain_source = "weather_entity_condition_string" if weather_state_obj else "fallback"
-
-        rain_mul = 0.4 if is_raining else 1.0
-        self._attributes["rain_multiplier"] = rain_mul
-        self._attributes["rain_source"] = rain_source
-
-        elevation = self._get_attr("sun.sun", "elevation", 0.0)
-        day_fac = max(0, min(1, (elevation + 6.0) / 66.0))
-        self._attributes["daylight_factor"] = round(day_fac, 3)
-
-        # --- Radiation (Calc) ---
-        rad_source = "heuristic"
-        rad_val = 0.0
-        if self.entity_solar:
-            rad = self._get_float(self.entity_solar, None)
-            if rad is not None:
-                rad_source = "sensor"
-                rad_val = rad
-                if rad_val > 1300:
-                    _LOGGER.warning(
-                        "Solar sensor value (%s W/m²) exceeds physical maximum. Using reported value.",
-                        rad_val,
-                    )
-        if rad_source != "sensor":
-            cloud_factor = max(0, 1 - (0.9 * (cloud / 100.0)))
-            base = (90 * uv) if uv > 0 else (100 * day_fac)
-            est = base * cloud_factor * rain_mul * day_fac
-            rad_val = min(1000, est)
-            rad_source = "heuristic"
-        rad_final = max(0.0, rad_val)
-        self._attributes["radiation"] = round(rad_final, 1)
-        self._attributes["radiation_source"] = rad_source
-
-        # --- Shading Factor ---
-        shading_factor = self._get_shading_factor()
-        self._attributes["shading_factor"] = round(shading_factor, 2)
-
-        # --- CALCULATE RADIANT BOOST ---
-        surface_setpoint = self._get_float(self.id_radiant_temp, 24.0)
-        type_state = self.hass.states.get(self.id_radiant_type)
-        type_key = type_state.state if type_state else "high_mass"
-        system_props = RADIANT_TYPES.get(type_key, RADIANT_TYPES["high_mass"])
-        boost_alpha = system_props["alpha"]
-        view_factor = system_props["view_factor"]
-
-        climate_state = (
-            self.hass.states.get(self.entity_climate) if self.entity_climate else None
-        )
-        target_boost = 0.0
-        if (
-            self.is_radiant
-            and climate_state
-            and climate_state.attributes.get("hvac_action") == "heating"
-        ):
-            delta_t = surface_setpoint - t_air
-            target_boost = delta_t * view_factor
-
-        new_boost = ((1.0 - boost_alpha) * self._radiant_boost_stored) + (
-            boost_alpha * target_boost
-        )
-        self._radiant_boost_stored = new_boost
-        self._attributes["radiant_boost_current"] = round(new_boost, 2)
 
-        # --- Incidence Factor ---
-        incidence_factor = self._get_solar_incidence_factor()
-        self._attributes["solar_incidence_factor"] = round(incidence_factor, 2)
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+):
+    """Set up sensors from a config entry."""
+    config = entry.data
+    device_type = config.get(
+        CONF_DEVICE_TYPE, "room"
+    )  # Default to room for old configs
+    device_info = get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
 
-        # --- MRT Calculation ---
-        term_loss = (
-            k_loss
-            * (t_air - t_out_eff)
-            * (f_out + 1.5 * f_win)
-            * (1 + 0.02 * wind_speed_ms)
-        )
-        term_solar = (
-            k_solar * (rad_final / 400.0) * incidence_factor * f_win * shading_factor
+    # --- BRANCH 1: AGGREGATOR ---
+    if device_type == TYPE_AGGREGATOR:
+        async_add_entities([VirtualZoneAggregator(hass, entry, device_info)])
+        return
+    # --- BRANCH 2: ROOM SENSOR SET ---
+    mrt_sensor = VirtualMRTSensor(hass, entry, device_info)
+    op_sensor = VirtualOperativeTempSensor(hass, entry, device_info, mrt_sensor)
+    entities = [mrt_sensor, op_sensor]
+    if config.get(CONF_RH_SENSOR):
+        entities.extend(
+            [
+                VirtualDewPointSensor(hass, entry, device_info),
+                VirtualFrostPointSensor(hass, entry, device_info),
+                VirtualAbsoluteHumiditySensor(hass, entry, device_info),
+                VirtualEnthalpySensor(hass, entry, device_info),
+                VirtualHumidexSensor(hass, entry, device_info),
+                VirtualPerceptionSensor(hass, entry, device_info),
+                VirtualMoldRiskSensor(hass, entry, device_info),
+                VirtualHeatFluxSensor(hass, entry, device_info, mrt_sensor),
+                VirtualPMVSensor(hass, entry, device_info, mrt_sensor),
+                VirtualMoistureExcessSensor(hass, entry, device_info),
+            ]
         )
-        mrt_calc = t_air - term_loss + term_solar + new_boost
-
-        self._attributes["loss_term"] = round(term_loss, 3)
-        self._attributes["solar_term"] = round(term_solar, 3)
-        self._attributes["mrt_unclamped"] = round(mrt_calc, 2)
-
-        # --- Estimated Wall Surface Temp ---
-        # Theoretical inner surface temp of the exterior wall
-        # T_surf = T_air - (Delta_T * k_loss)
-        # We use t_out_eff to account for wind chill cooling the exterior
-        if t_air is not None and t_out_eff is not None:
-            t_wall_est = t_air - ((t_air - t_out_eff) * k_loss)
-            self._attributes["estimated_wall_surface_temp"] = round(t_wall_est, 1)
-
-        # --- Clamping ---
-        lower_dyn = max(t_out_eff + 2.0, t_air - 3.0)
-        upper_dyn = t_air + 4.0
-        mrt_clamped = max(lower_dyn, min(mrt_calc, upper_dyn))
-        self._attributes["mrt_clamped"] = round(mrt_clamped, 2)
-
-        # --- Smoothing ---
-        if self._mrt_prev is None:
-            self._mrt_prev = mrt_clamped
-
-        mrt_final = ((1.0 - alpha) * self._mrt_prev) + (alpha * mrt_clamped)
-        self._mrt_prev = mrt_final
-
-        # --- Final Value ---
-        self._attr_native_value = round(mrt_final, 2)
-
-
+    if config.get(CONF_WALL_SURFACE_SENSOR):
+        entities.append(VirtualCalibrationSensor(hass, entry, device_info))
+    async_add_entities(entities)
 
 
 class VirtualOperativeTempSensor(SensorEntity):
-    # ... (Rest of VirtualOperativeTempSensor remains the same) ...
     """Calculates Operative Temp: (Air + MRT) / 2."""
 
     _attr_has_entity_name = True
@@ -850,12 +163,16 @@ class VirtualOperativeTempSensor(SensorEntity):
         """Icon of the entity"""
         return "mdi:home-thermometer"
 
-    def _calculate_convective_weighting(self, v_air: float) -> float:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _calculate_convective_weighting(v_air: float) -> float:
         """
         Calculates the Radiant Weighting factor (A) based on air speed (v_air)
         using the simplified ASHRAE heat transfer coefficients (hc and hr).
 
         The final formula is A = hr / (hc + hr).
+        Memoized: v_air comes from the MRT sensor's attribute, rounded to
+        0.01 m/s, and mostly sits on a few fan/HVAC/window presets.
         """
 
         # Ensure v_air is non-negative for math.pow
@@ -887,14 +204,17 @@ class VirtualOperativeTempSensor(SensorEntity):
         air_state = self.hass.states.get(self._air_entity)
 
         if self._mrt_sensor.extra_state_attributes:
-            self._attributes = self._mrt_sensor.extra_state_attributes.copy()
+            # Layer our own attributes over the MRT ones without copying them;
+            # writes land in the first map and the MRT sensor replaces (never
+            # mutates) its dict once a calculation is done
+            self._attributes = ChainMap({}, self._mrt_sensor.extra_state_attributes)
         else:
             self._attributes = {}
 
         if (
             mrt is not None
             and air_state
-            and air_state.state not in ["unknown", "unavailable"]
+            and air_state.state not in UNUSABLE_STATES
         ):
             try:
                 air = float(air_state.state)
@@ -1069,12 +389,16 @@ class Psychrometrics:
         rho = (p_dry_pa / (R_d * t_kelvin)) + (e_pa / (R_v * t_kelvin))
         return rho
 
+    # The psychrometric sensors of a device all convert the same readings;
+    # cache on the exact inputs so each distinct value is computed once
     @staticmethod
+    @lru_cache(maxsize=256)
     def calculate_vapor_pressure(t_air: float) -> float:
         """Calculate saturation vapor pressure (hPa) using Magnus formula."""
         return 6.112 * math.exp((17.67 * t_air) / (t_air + 243.5))
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calculate_dew_point(t_air: float, rh: float) -> float:
         """Calculate Dew Point (°C)."""
         if rh <= 0:
@@ -1160,10 +484,29 @@ class VirtualPsychroBase(SensorEntity):
             entities.append(self.entity_weather)
 
         self.async_on_remove(
-            async_track_state_change_event(self.hass, entities, self._handle_update)
+            async_track_state_change_event(
+                self.hass, entities, self._handle_input_update
+            )
         )
         self._handle_update(None)
 
+    @callback
+    def _handle_input_update(self, event):
+        """Handle an input change; skip it if nothing read from it changed."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if old_state is not None and new_state is not None:
+            # Only the pressure attribute of the weather entity is used here,
+            # while weather updates mostly change its other attributes
+            if event.data["entity_id"] == self.entity_weather:
+                old_value = old_state.attributes.get("pressure")
+                new_value = new_state.attributes.get("pressure")
+            else:
+                old_value, new_value = old_state.state, new_state.state
+            if old_value == new_value:
+                return
+        self._handle_update(event)
+
     def _get_pressure(self) -> float:
         """
         Get absolute station pressure in hPa.
@@ -1179,7 +522,7 @@ class VirtualPsychroBase(SensorEntity):
         # 1. Dedicated Sensor (Trust as Absolute)
         if self.entity_pressure:
             state = self.hass.states.get(self.entity_pressure)
-            if state and state.state not in ["unknown", "unavailable"]:
+            if state and state.state not in UNUSABLE_STATES:
                 try:
                     # Return immediately - assume local sensor reads actual local pressure
                     return float(state.state)
@@ -1222,8 +565,8 @@ class VirtualPsychroBase(SensorEntity):
         if (
             not t_state
             or not rh_state
-            or t_state.state in ["unknown", "unavailable"]
-            or rh_state.state in ["unknown", "unavailable"]
+            or t_state.state in UNUSABLE_STATES
+            or rh_state.state in UNUSABLE_STATES
         ):
             self._attr_native_value = None
             return
@@ -1359,7 +702,7 @@ class VirtualEnthalpySensor(VirtualPsychroBase):
         """Helper to safely get float state."""
         if not entity_id: return None
         state = self.hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
+        if state and state.state not in UNUSABLE_STATES:
             try:
                 return float(state.state)
             except ValueError:
@@ -1536,7 +879,7 @@ class VirtualMoldRiskSensor(VirtualPsychroBase):
         if not entity_id:
             return default
         state = self.hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
+        if state and state.state not in UNUSABLE_STATES:
             try:
                 return float(state.state)
             except ValueError:
@@ -1696,7 +1039,7 @@ class VirtualCalibrationSensor(SensorEntity):
     def _get_float_state(self, entity_id, default=None):
         if not entity_id: return default
         state = self.hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
+        if state and state.state not in UNUSABLE_STATES:
             try:
                 return float(state.state)
             except ValueError:
@@ -1869,7 +1212,7 @@ class VirtualHeatFluxSensor(VirtualPsychroBase):
         if not entity_id:
             return default
         state = self.hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
+        if state and state.state not in UNUSABLE_STATES:
             try:
                 return float(state.state)
             except ValueError:
@@ -2053,7 +1396,7 @@ class VirtualPMVSensor(SensorEntity):
         if not entity_id:
             return default
         state = self.hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
+        if state and state.state not in UNUSABLE_STATES:
             try:
                 return float(state.state)
             except ValueError:
@@ -2067,7 +1410,7 @@ class VirtualPMVSensor(SensorEntity):
         # to ensure we are using the exact same synchronized physics snapshot.
 
         mrt_state = self.hass.states.get(self.mrt_sensor.entity_id)
-        if not mrt_state or mrt_state.state in ["unknown", "unavailable"]:
+        if not mrt_state or mrt_state.state in UNUSABLE_STATES:
             self._attr_native_value = None
             return
 
@@ -2150,23 +1493,24 @@ class VirtualMoistureExcessSensor(VirtualPsychroBase):
         # Base tracks Indoor T, Indoor RH, Pressure, Weather
         await super().async_added_to_hass()
 
-        # We also need to track dedicated outdoor sensors if they exist
-        entities = []
+        # We also need to track dedicated outdoor sensors if they exist, and
+        # the weather entity for its temperature/humidity fallback (the base
+        # listener only reacts to its pressure)
+        entities = [self.entity_weather]
         if self.entity_outdoor_temp:
             entities.append(self.entity_outdoor_temp)
         if self.entity_outdoor_hum:
             entities.append(self.entity_outdoor_hum)
 
-        if entities:
-            self.async_on_remove(
-                async_track_state_change_event(self.hass, entities, self._handle_update)
-            )
+        self.async_on_remove(
+            async_track_state_change_event(self.hass, entities, self._handle_update)
+        )
 
     def _get_float_state(self, entity_id, default=None):
         if not entity_id:
             return default
         state = self.hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
+        if state and state.state not in UNUSABLE_STATES:
             try:
                 return float(state.state)
             except ValueError:
@@ -2298,7 +1642,7 @@ class VirtualZoneAggregator(SensorEntity):
 
         for entity_id in self.monitored_entities:
             state_obj = self.hass.states.get(entity_id)
-            if not state_obj or state_obj.state in ["unknown", "unavailable"]:
+            if not state_obj or state_obj.state in UNUSABLE_STATES:
                 continue
 
             entry = registry.async_get(entity_id)
@@ -2497,6 +1841,75 @@ class VirtualZoneAggregator(SensorEntity):
         self.schedule_update_ha_state()
 
 
+# (attribute, platform, unique-id suffix) of the controls the MRT sensor reads
+MRT_CONTROLS = (
+    ("id_f_out", "number", "f_out"),
+    ("id_f_win", "number", "f_win"),
+    ("id_k_loss", "number", "k_loss"),
+    ("id_k_solar", "number", "k_solar"),
+    ("id_profile_select", "select", "profile"),
+    ("id_thermal_alpha", "number", CONF_THERMAL_ALPHA),
+    ("id_manual_speed", "number", CONF_MANUAL_AIR_SPEED),
+    ("id_hvac_speed", "number", CONF_HVAC_AIR_SPEED),
+)
+# Extra controls that only exist when radiant heating is enabled
+MRT_RADIANT_CONTROLS = (
+    ("id_radiant_temp", "number", CONF_RADIANT_SURFACE_TEMP),
+    ("id_radiant_type", "select", CONF_RADIANT_TYPE),
+)
+
+# hvac_action values of a climate entity that is not moving air
+HVAC_IDLE_ACTIONS = frozenset({"off", "idle", None})
+# Fan entity states that contribute no air movement
+FAN_OFF_STATES = frozenset({"off", "unavailable", "unknown", None})
+
+# Attributes that force a state write when they move more than the threshold,
+# even though the rounded MRT itself is unchanged
+MRT_WRITE_THRESHOLD_ATTRS = ("mrt_clamped", "loss_term", "solar_term")
+MRT_WRITE_THRESHOLD = 0.01
+# Attributes other sensors read from the MRT sensor (PMV from its state;
+# operative temperature and heat flux from the entity); any change is written
+MRT_WRITE_EXACT_ATTRS = ("air_speed_ms_convective", "t_air")
+# Substrings of a weather condition that mean precipitation
+RAIN_CONDITION_KEYWORDS = ("rain", "pour", "snow", "hail")
+
+
+def _shading_cover(state_obj, state: str) -> float:
+    """Shading factor of a cover: its open position, else open/closed."""
+    current_pos = state_obj.attributes.get("current_position")
+    if current_pos is not None:
+        try:
+            return float(current_pos) / 100.0
+        except ValueError:
+            pass
+    return 0.0 if state == "closed" else 1.0
+
+
+def _shading_number(state_obj, state: str) -> float:
+    """Shading factor of a numeric entity, as a 0-1 fraction or a percentage."""
+    try:
+        val = float(state)
+    except ValueError:
+        return 1.0
+    if val > 1.0:
+        return min(1.0, val / 100.0)
+    return max(0.0, val)
+
+
+def _shading_binary(state_obj, state: str) -> float:
+    """Shading factor of an on/off entity; anything else counts as unshaded."""
+    return 0.0 if state == "off" else 1.0
+
+
+# Shading factor handlers by entity domain; other domains are read as binary
+SHADING_HANDLERS = {
+    "cover": _shading_cover,
+    "input_number": _shading_number,
+    "sensor": _shading_number,
+    "number": _shading_number,
+}
+
+
 class VirtualMRTSensor(SensorEntity):
     """Calculates Mean Radiant Temperature."""
 
@@ -2531,16 +1944,21 @@ class VirtualMRTSensor(SensorEntity):
         self.entity_wind_speed = self._config.get(CONF_WIND_SPEED_SENSOR)
         self.entity_rain = self._config.get(CONF_PRECIPITATION_SENSOR)
         self.entity_uv = self._config.get(CONF_UV_INDEX_SENSOR)
+        # Fallbacks of f_out, f_win, k_loss, k_solar (setup profile) and alpha
+        self._factor_defaults = (
+            *ROOM_PROFILES[self._config[CONF_ROOM_PROFILE]]["data"],
+            0.3,
+        )
         orient_code = self._config[CONF_ORIENTATION]
-        self.orientation_degrees = ORIENTATION_DEGREES.get(orient_code, 180)
+        self.orientation_radians = ORIENTATION_RADIANS.get(orient_code, math.pi)
         self._radiant_boost_stored = 0.0
+        # ((t_out, rh_out), outdoor vapor pressure) of the last apparent temp
+        self._vapor_pressure_cache = None
         self.is_radiant = self._config.get(CONF_IS_RADIANT, False)
 
         self._attr_native_value = None
         self._mrt_prev = None
         self._attributes = {}
-        self._last_update_time = 0.0
-        self._min_update_interval = 60.0  # Seconds
 
         # Entity IDs of the number inputs, to be found
         self.id_f_out = None
@@ -2555,8 +1973,23 @@ class VirtualMRTSensor(SensorEntity):
         self.id_radiant_temp = None
 
         self._min_update_interval = self._config.get(CONF_MIN_UPDATE_INTERVAL, 30.0)
-        self._last_update_time = 0.0
+        # Monotonic time of the last calculation; the first one is never held back
+        self._last_update_time = float("-inf")
         self._cancel_scheduled_update = None
+        # (value, *MRT_WRITE_EXACT_ATTRS, *MRT_WRITE_THRESHOLD_ATTRS) as of the
+        # last state write
+        self._last_written = None
+
+        # Control lookups, resolved once (or as the controls get registered)
+        self._uid_prefix = entry.entry_id + "_"
+        self._controls = (
+            MRT_CONTROLS + MRT_RADIANT_CONTROLS if self.is_radiant else MRT_CONTROLS
+        )
+        self._ids_ready = False
+        # Factor control IDs in _factor_defaults order, set once all are known
+        self._factor_ids: tuple[str, ...] = ()
+        self._tracked_controls: set[str] = set()
+        self._unsub_registry_updated = None
 
     @property
     def extra_state_attributes(self):
@@ -2567,41 +2000,13 @@ class VirtualMRTSensor(SensorEntity):
         """Find number entities and register listeners."""
         await super().async_added_to_hass()
 
-        # Find the entity IDs of the number controls
-        registry = er.async_get(self.hass)
-        self.id_f_out = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_f_out"
-        )
-        self.id_f_win = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_f_win"
-        )
-        self.id_k_loss = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_k_loss"
-        )
-        self.id_k_solar = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_k_solar"
-        )
-        self.id_profile_select = registry.async_get_entity_id(
-            "select", DOMAIN, f"{self._entry.entry_id}_profile"
-        )
-        self.id_thermal_alpha = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_{CONF_THERMAL_ALPHA}"
-        )
-        self.id_manual_speed = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_{CONF_MANUAL_AIR_SPEED}"
-        )
-        self.id_hvac_speed = registry.async_get_entity_id(
-            "number", DOMAIN, f"{self._entry.entry_id}_{CONF_HVAC_AIR_SPEED}"
-        )
-
-        # Only look for these if radiant heating is enabled
-        if self.is_radiant:
-            self.id_radiant_temp = registry.async_get_entity_id(
-                "number", DOMAIN, f"{self._entry.entry_id}_{CONF_RADIANT_SURFACE_TEMP}"
-            )
-            self.id_radiant_type = registry.async_get_entity_id(
-                "select", DOMAIN, f"{self._entry.entry_id}_{CONF_RADIANT_TYPE}"
+        # Find the entity IDs of the number controls; any not registered yet
+        # are picked up from registry updates
+        if not self._resolve_ids():
+            self._unsub_registry_updated = self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._handle_registry_updated
             )
+            self.async_on_remove(self._stop_registry_listener)
 
         # Core entities to listen to
         entities_to_track = [self.entity_air, self.entity_weather, "sun.sun"]
@@ -2632,31 +2037,12 @@ class VirtualMRTSensor(SensorEntity):
         if self.entity_uv:
             entities_to_track.append(self.entity_uv)
 
-        # Add number entities (if found)
-        for num_id in [
-            self.id_f_out,
-            self.id_f_win,
-            self.id_k_loss,
-            self.id_k_solar,
-            self.id_thermal_alpha,
-            self.id_manual_speed,
-            self.id_hvac_speed,
-            self.id_radiant_temp,
-        ]:
-            if num_id:
-                entities_to_track.append(num_id)
-
-        # Add select entity (if found)
-        if self.id_profile_select:
-            entities_to_track.append(self.id_profile_select)
-        if self.id_radiant_type:
-            entities_to_track.append(self.id_radiant_type)
-
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass, entities_to_track, self._handle_update
             )
         )
+        self._track_controls()
         self._update_calc()  # Initial update
 
     @property
@@ -2667,29 +2053,100 @@ class VirtualMRTSensor(SensorEntity):
     @callback
     def _handle_update(self, event):
         """Handle entity state changes with Rate Limiting."""
-        now = time.time()
-        time_since = now - self._last_update_time
-
         # 1. If interval is 0, update instantly (No throttle)
         if self._min_update_interval <= 0:
             self._perform_update()
             return
 
-        # 2. If enough time has passed, update immediately
+        # 2. An update is already scheduled for the end of the interval; it
+        # will read the latest states, so this change needs nothing more
+        if self._cancel_scheduled_update:
+            return
+
+        time_since = time.monotonic() - self._last_update_time
+
+        # 3. If enough time has passed, update immediately
         if time_since >= self._min_update_interval:
             self._perform_update()
         else:
-            # 3. If too soon, schedule an update for the end of the interval
-            # We cancel any existing timer so we don't stack updates
-            if self._cancel_scheduled_update:
-                self._cancel_scheduled_update()
-                self._cancel_scheduled_update = None
-
+            # 4. If too soon, schedule an update for the end of the interval
             delay = self._min_update_interval - time_since
             self._cancel_scheduled_update = async_call_later(
                 self.hass, delay, self._scheduled_update_callback
             )
 
+    @callback
+    def _resolve_ids(self) -> bool:
+        """Look up the control entity IDs still missing; True once all are known."""
+        get_entity_id = er.async_get(self.hass).async_get_entity_id
+        prefix = self._uid_prefix
+        ready = True
+        for attr, platform, suffix in self._controls:
+            if getattr(self, attr) is None:
+                entity_id = get_entity_id(platform, DOMAIN, prefix + suffix)
+                setattr(self, attr, entity_id)
+                ready = ready and entity_id is not None
+        if ready:
+            self._factor_ids = (
+                self.id_f_out,
+                self.id_f_win,
+                self.id_k_loss,
+                self.id_k_solar,
+                self.id_thermal_alpha,
+            )
+        self._ids_ready = ready
+        return ready
+
+    @callback
+    def _track_controls(self) -> None:
+        """Listen to the found controls that are not tracked yet."""
+        # Our own number/select controls are tracked apart from the inputs,
+        # so attribute-only updates of them don't trigger a recalculation
+        new_controls = [
+            entity_id
+            for attr, _, _ in self._controls
+            if (entity_id := getattr(self, attr))
+            and entity_id not in self._tracked_controls
+        ]
+        if not new_controls:
+            return
+        self._tracked_controls.update(new_controls)
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, new_controls, self._handle_control_update
+            )
+        )
+
+    @callback
+    def _handle_registry_updated(self, event):
+        """Pick up controls that were registered after this sensor."""
+        if event.data["action"] != "create" or not self._resolve_ids():
+            return
+        _LOGGER.debug("All control entities found for %s", self.entity_id)
+        self._stop_registry_listener()
+        self._track_controls()
+        self._handle_update(event)
+
+    @callback
+    def _stop_registry_listener(self) -> None:
+        """Stop waiting for control registrations."""
+        if self._unsub_registry_updated:
+            self._unsub_registry_updated()
+            self._unsub_registry_updated = None
+
+    @callback
+    def _handle_control_update(self, event):
+        """Handle a number/select control change; skip it if its value is unchanged."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+        ):
+            return
+        self._handle_update(event)
+
     @callback
     def _scheduled_update_callback(self, _):
         """Called when the rate-limit timer expires."""
@@ -2698,25 +2155,55 @@ class VirtualMRTSensor(SensorEntity):
 
     def _perform_update(self):
         """Actually run the calc and write state."""
-        self._last_update_time = time.time()
+        self._last_update_time = time.monotonic()
         self._update_calc()
+
+        # The smoothed, rounded MRT often doesn't move between updates; skip
+        # the state write (recorder/websocket traffic) when nothing notable did
+        attrs = self._attributes
+        snapshot = (
+            self._attr_native_value,
+            *(attrs.get(key) for key in MRT_WRITE_EXACT_ATTRS),
+            *(attrs.get(key) for key in MRT_WRITE_THRESHOLD_ATTRS),
+        )
+        if not self._is_significant_change(snapshot):
+            return
+        self._last_written = snapshot
         self.async_write_ha_state()
 
+    def _is_significant_change(self, snapshot) -> bool:
+        """Whether the value or a key attribute moved since the last write."""
+        last = self._last_written
+        exact = 1 + len(MRT_WRITE_EXACT_ATTRS)
+        if last is None or snapshot[:exact] != last[:exact]:
+            return True
+        for new, old in zip(snapshot[exact:], last[exact:]):
+            if new is None or old is None:
+                if new is not old:
+                    return True
+            elif abs(new - old) > MRT_WRITE_THRESHOLD:
+                return True
+        return False
+
     def _get_float(self, entity_id, default=0.0):
         """Helper to get float from state."""
         if not entity_id:
             return default
-        state = self.hass.states.get(entity_id)
-        if not state or state.state in ["unknown", "unavailable"]:
+        return self._state_float(self.hass.states.get(entity_id), default)
+
+    @staticmethod
+    def _state_float(state, default):
+        """Helper to get float from an already fetched state."""
+        if not state or state.state in UNUSABLE_STATES:
             return default
         try:
             return float(state.state)
         except ValueError:
             return default
 
-    def _get_attr(self, entity_id, attr, default=None):
-        """Helper to get attribute."""
-        state = self.hass.states.get(entity_id)
+    @staticmethod
+    def _get_attr(state, attr, default=None):
+        """Helper to get a float attribute from an already fetched state."""
         if not state:
             return default
         val = state.attributes.get(attr)
@@ -2725,26 +2212,21 @@ class VirtualMRTSensor(SensorEntity):
         except ValueError:
             return default
 
-    def _get_solar_incidence_factor(self) -> float:
+    def _get_solar_incidence_factor(self, sun_state) -> float:
         """Calculates how directly the sun is shining on the window."""
-        sun_state = self.hass.states.get("sun.sun")
         if not sun_state:
             return 0.1  # Fallback to diffuse only
 
         sun_azimuth = sun_state.attributes.get("azimuth", 180)
 
-        # Calculate difference between Sun and Window
-        diff = abs(sun_azimuth - self.orientation_degrees)
-        if diff > 180:
-            diff = 360 - diff
+        # Cosine of the angle between Sun and Window; cos is even and periodic,
+        # so the raw azimuth difference needs no folding into 0..180
+        cosine_factor = math.cos(math.radians(sun_azimuth) - self.orientation_radians)
 
-        # If the sun is more than 90 degrees off-axis, only diffuse (skylight).
-        if diff >= 90:
+        # If the sun is 90 degrees or more off-axis, only diffuse (skylight).
+        if cosine_factor <= 0:
             return 0.1
 
-        # Calculate cosine of the angle
-        cosine_factor = math.cos(math.radians(diff))
-
         # Result is Cosine + Diffuse Baseline (clamped to 1.0 max)
         return min(1.0, cosine_factor + 0.1)
 
@@ -2754,92 +2236,75 @@ class VirtualMRTSensor(SensorEntity):
             return 1.0
 
         state_obj = self.hass.states.get(self.entity_shading)
-        if not state_obj or state_obj.state in ["unavailable", "unknown", None]:
+        if not state_obj or state_obj.state in UNUSABLE_STATES:
             return 1.0
 
-        domain = state_obj.domain
         state = state_obj.state
-
-        # --- CASE 1: COVERS ---
-        if domain == "cover":
-            current_pos = state_obj.attributes.get("current_position")
-            if current_pos is not None:
-                try:
-                    return float(current_pos) / 100.0
-                except ValueError:
-                    pass
-            return 0.0 if state == "closed" else 1.0
-
-        # --- CASE 2: NUMBERS / SENSORS ---
-        if domain in ["input_number", "sensor", "number"]:
-            try:
-                val = float(state)
-                if val > 1.0:
-                    return min(1.0, val / 100.0)
-                return max(0.0, val)
-            except ValueError:
-                return 1.0
-
-        # --- CASE 3: BINARY ---
-        if state == "on":
-            return 1.0
-        if state == "off":
-            return 0.0
-
-        return 1.0
+        handler = SHADING_HANDLERS.get(state_obj.domain, _shading_binary)
+        return handler(state_obj, state)
 
     def _calculate_v_air(self) -> float:
         """Determines the effective air velocity (m/s) based on priority logic."""
         # Note: This function assumes IDs are valid or None.
+        states_get = self.hass.states.get
 
-        # Read new entity states
-        climate_state = (
-            self.hass.states.get(self.entity_climate) if self.entity_climate else None
-        )
-        window_state = (
-            self.hass.states.get(self.entity_window) if self.entity_window else None
-        )
-        door_state = (
-            self.hass.states.get(self.entity_door) if self.entity_door else None
-        )
-        fan_state = self.hass.states.get(self.entity_fan) if self.entity_fan else None
-
-        # Start with default still air speed
-        potential_speeds = [DEFAULT_AIR_SPEED_STILL]
+        # Start with default still air speed; each source can only raise it
+        v_air = DEFAULT_AIR_SPEED_STILL
 
         # --- Check Manual Override ---
         manual_speed = self._get_float(self.id_manual_speed, 0.0)
-        if manual_speed > 0:
-            potential_speeds.append(manual_speed)
+        if manual_speed > v_air:
+            v_air = manual_speed
 
         # --- Check Natural Ventilation ---
-        if window_state and window_state.state.lower() == "on":
-            potential_speeds.append(DEFAULT_AIR_SPEED_WINDOW)
+        # Binary sensor states are always lowercase "on"/"off"
+        if self.entity_window:
+            window_state = states_get(self.entity_window)
+            if (
+                window_state
+                and window_state.state == "on"
+                and DEFAULT_AIR_SPEED_WINDOW > v_air
+            ):
+                v_air = DEFAULT_AIR_SPEED_WINDOW
 
-        if door_state and door_state.state.lower() == "on":
-            potential_speeds.append(DEFAULT_AIR_SPEED_DOOR)
+        if self.entity_door:
+            door_state = states_get(self.entity_door)
+            if (
+                door_state
+                and door_state.state == "on"
+                and DEFAULT_AIR_SPEED_DOOR > v_air
+            ):
+                v_air = DEFAULT_AIR_SPEED_DOOR
 
         # --- Check HVAC (Forced Air) ---
         hvac_speed_setting = self._get_float(self.id_hvac_speed, DEFAULT_AIR_SPEED_HVAC)
-        if not self.is_radiant:
+        if not self.is_radiant and self.entity_climate:
+            climate_state = states_get(self.entity_climate)
             if climate_state:
                 attrs = climate_state.attributes
-                is_active = attrs.get("hvac_action") not in ["off", "idle", None]
+                is_active = attrs.get("hvac_action") not in HVAC_IDLE_ACTIONS
                 is_fan_forced = attrs.get("fan_mode") == "on"
 
-                if is_active or is_fan_forced:
-                    potential_speeds.append(hvac_speed_setting)
+                if (is_active or is_fan_forced) and hvac_speed_setting > v_air:
+                    v_air = hvac_speed_setting
 
         # --- Check Local Fan Entity ---
-        if fan_state and fan_state.state not in ["off", "unavailable", "unknown", None]:
-            fan_speed_key = str(fan_state.state).lower()
-            fan_speed = FAN_SPEED_MAP.get(fan_speed_key, hvac_speed_setting)
-            potential_speeds.append(fan_speed)
+        fan_state = states_get(self.entity_fan) if self.entity_fan else None
+        if fan_state and fan_state.state not in FAN_OFF_STATES:
+            # States are strings and FAN_SPEED_MAP keys are lowercase; most
+            # fans already report lowercase, so only fold case on a miss
+            fan_speed = FAN_SPEED_MAP.get(fan_state.state)
+            if fan_speed is None:
+                fan_speed = FAN_SPEED_MAP.get(
+                    fan_state.state.lower(), hvac_speed_setting
+                )
+            if fan_speed > v_air:
+                v_air = fan_speed
 
-        return max(potential_speeds)
+        return v_air
 
     def _calculate_local_apparent_temp(
-            self, t_out: float, wind_ms: float
+            self, t_out: float, wind_ms: float, weather_state
     ) -> float | None:
         """
         Calculates Apparent Temperature (AAT) using local sensors.
@@ -2848,18 +2313,24 @@ class VirtualMRTSensor(SensorEntity):
         """
         # 1. Get Outdoor Humidity (Local > Weather > Fail)
         rh_out = self._get_float(self.entity_outdoor_hum, None)
-        if rh_out is None:
-            w_state = self.hass.states.get(self.entity_weather)
-            if w_state:
-                rh_out = w_state.attributes.get("humidity")
+        if rh_out is None and weather_state:
+            rh_out = weather_state.attributes.get("humidity")
 
         if rh_out is None:
             return None  # Cannot calculate without humidity
 
         # 2. Calculate Vapor Pressure (hPa)
-        # Use the static helper from Psychrometrics
-        vp_sat = Psychrometrics.calculate_vapor_pressure(t_out)
-        vp_actual = vp_sat * (rh_out / 100.0)
+        # Outdoor readings change far less often than the sensor recalculates,
+        # so reuse the last result while (t_out, rh_out) is unchanged
+        key = (t_out, rh_out)
+        cached = self._vapor_pressure_cache
+        if cached is not None and cached[0] == key:
+            vp_actual = cached[1]
+        else:
+            # Use the static helper from Psychrometrics
+            vp_sat = Psychrometrics.calculate_vapor_pressure(t_out)
+            vp_actual = vp_sat * (rh_out / 100.0)
+            self._vapor_pressure_cache = (key, vp_actual)
 
         # 3. Apply AAT Formula
         # Note: wind_ms is raw here; in strict meteorology it's avg'd, but raw is fine.
@@ -2871,155 +2342,75 @@ class VirtualMRTSensor(SensorEntity):
         """Perform the math and store all intermediate values."""
 
         # --- 1. ROBUST ENTITY CHECK ---
-        # We must verify that ALL required internal entity IDs have been found
-        # before we attempt to read their states.
-
-        # Start with common entities
-        required_ids = [
-            self.id_f_out,
-            self.id_f_win,
-            self.id_k_loss,
-            self.id_k_solar,
-            self.id_profile_select,
-            self.id_thermal_alpha,
-            self.id_manual_speed,
-            self.id_hvac_speed,
-        ]
-
-        # Conditional Check: Only require Radiant IDs if radiant is enabled
-        if self.is_radiant:
-            required_ids.append(self.id_radiant_temp)
-            required_ids.append(self.id_radiant_type)
-
-        if not all(required_ids):
-            _LOGGER.debug("Entities not yet registered, trying to find them...")
-            registry = er.async_get(self.hass)
-
-            # Try to populate missing IDs
-            if not self.id_f_out:
-                self.id_f_out = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_f_out"
-                )
-            if not self.id_f_win:
-                self.id_f_win = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_f_win"
-                )
-            if not self.id_k_loss:
-                self.id_k_loss = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_k_loss"
-                )
-            if not self.id_k_solar:
-                self.id_k_solar = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_k_solar"
-                )
-            if not self.id_profile_select:
-                self.id_profile_select = registry.async_get_entity_id(
-                    "select", DOMAIN, f"{self._entry.entry_id}_profile"
-                )
-            if not self.id_thermal_alpha:
-                self.id_thermal_alpha = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_{CONF_THERMAL_ALPHA}"
-                )
-            if not self.id_manual_speed:
-                self.id_manual_speed = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_{CONF_MANUAL_AIR_SPEED}"
-                )
-            if not self.id_hvac_speed:
-                self.id_hvac_speed = registry.async_get_entity_id(
-                    "number", DOMAIN, f"{self._entry.entry_id}_{CONF_HVAC_AIR_SPEED}"
-                )
-
-            # Populate Radiant IDs if needed
-            if self.is_radiant:
-                if not self.id_radiant_temp:
-                    self.id_radiant_temp = registry.async_get_entity_id(
-                        "number",
-                        DOMAIN,
-                        f"{self._entry.entry_id}_{CONF_RADIANT_SURFACE_TEMP}",
-                    )
-                if not self.id_radiant_type:
-                    self.id_radiant_type = registry.async_get_entity_id(
-                        "select", DOMAIN, f"{self._entry.entry_id}_{CONF_RADIANT_TYPE}"
-                    )
-
-            # Re-check. If still missing, we cannot proceed.
-            # We must use 'required_ids' check again with updated values
+        # All required internal entity IDs must be known before we read their
+        # states; they are filled in by _resolve_ids as the controls register.
+        if not self._ids_ready:
+            _LOGGER.debug(
+                "Could not find all required entities for %s, calculation will be delayed.",
+                self.entity_id,
+            )
+            return
 
-            # Rebuild check list
-            check_list = [
-                self.id_f_out,
-                self.id_f_win,
-                self.id_k_loss,
-                self.id_k_solar,
-                self.id_profile_select,
-                self.id_thermal_alpha,
-                self.id_manual_speed,
-                self.id_hvac_speed,
-            ]
-            if self.is_radiant:
-                check_list.append(self.id_radiant_temp)
-                check_list.append(self.id_radiant_type)
-
-            if not all(check_list):
-                _LOGGER.debug(
-                    "Could not find all required entities for %s, calculation will be delayed.",
-                    self.entity_id,
-                )
-                return
+        # --- Start fresh on attributes; built locally and published in one go
+        attrs = {}
 
-        # --- Start fresh on attributes
-        self._attributes = {}
+        # States read more than once below; fetch them a single time
+        weather_state = self.hass.states.get(self.entity_weather)
+        sun_state = self.hass.states.get("sun.sun")
 
         # --- Calculate Air Speed (v_air) ---
         v_air = self._calculate_v_air()
-        self._attributes["air_speed_ms_convective"] = round(v_air, 2)
+        attrs["air_speed_ms_convective"] = round(v_air, 2)
 
         # --- Profile Info ---
         profile_key = self._config[CONF_ROOM_PROFILE]
         if self.id_profile_select:
             profile_state = self.hass.states.get(self.id_profile_select)
-            if profile_state and profile_state.state not in ["unknown", "unavailable"]:
+            if profile_state and profile_state.state not in UNUSABLE_STATES:
                 profile_key = profile_state.state
-        self._attributes["profile"] = profile_key
-        self._attributes["orientation"] = self._config[CONF_ORIENTATION]
+        attrs["profile"] = profile_key
+        attrs["orientation"] = self._config[CONF_ORIENTATION]
 
         # --- T_air (Input) ---
         t_air = self._get_float(self.entity_air, None)
         if t_air is None:
+            self._attributes = attrs
             return
-        self._attributes["t_air"] = t_air
+        attrs["t_air"] = t_air
 
         # --- T_out (Input) ---
         t_out = self._get_float(self.entity_outdoor_temp, None)
         if t_out is None:
-            t_out = self._get_attr(self.entity_weather, "temperature")
+            t_out = self._get_attr(weather_state, "temperature")
         if t_out is None:
             # If we have absolutely no data, we can't run the physics model safely.
+            self._attributes = attrs
             return
 
         # --- Wind (Input) ---
         wind_speed_ms = self._get_float(self.entity_wind_speed, None)
         if wind_speed_ms is None:
-            wind_speed_ms = self._get_attr(self.entity_weather, "wind_speed", 0.0)
-        weather_state_obj = self.hass.states.get(self.entity_weather)
+            wind_speed_ms = self._get_attr(weather_state, "wind_speed", 0.0)
         if (
-                weather_state_obj
-                and weather_state_obj.attributes.get("wind_speed_unit") == "km/h"
+                weather_state
+                and weather_state.attributes.get("wind_speed_unit") == "km/h"
         ):
             wind_speed_ms = wind_speed_ms / 3.6
         wind_speed_kmh = wind_speed_ms * 3.6
-        self._attributes["wind_ms"] = round(wind_speed_ms, 2)
-        self._attributes["wind_kmh"] = round(wind_speed_kmh, 2)
-        self._attributes["wind_source"] = "weather_entity"
+        attrs["wind_ms"] = round(wind_speed_ms, 2)
+        attrs["wind_kmh"] = round(wind_speed_kmh, 2)
+        attrs["wind_source"] = "weather_entity"
 
         # We want the "Feels Like" temp because that drives heat loss better than dry bulb.
         # Try to calculate locally first (Most Accurate)
-        t_app = self._calculate_local_apparent_temp(t_out, wind_speed_ms)
+        t_app = self._calculate_local_apparent_temp(
+            t_out, wind_speed_ms, weather_state
+        )
         t_out_source = "calculated_local_aat"
 
         if t_app is None:
             # Fallback to weather entity attribute
-            t_app = self._get_attr(self.entity_weather, "apparent_temperature")
+            t_app = self._get_attr(weather_state, "apparent_temperature")
             t_out_source = "weather_entity_attr"
 
         # Use the lower of the two (Conservative for heating: Wind Chill matters)
@@ -3030,31 +2421,31 @@ class VirtualMRTSensor(SensorEntity):
             t_out_eff = t_out
             t_out_source = "dry_bulb_clamped"
 
-        self._attributes["t_out_eff"] = round(t_out_eff, 2)
-        self._attributes["t_out_eff_source"] = t_out_source
+        attrs["t_out_eff"] = round(t_out_eff, 2)
+        attrs["t_out_eff_source"] = t_out_source
 
         # --- Dynamic Factors (Inputs) ---
-        config_profile_key = self._config[CONF_ROOM_PROFILE]
-        defaults = ROOM_PROFILES[config_profile_key]["data"]
-        f_out = self._get_float(self.id_f_out, defaults[0])
-        f_win = self._get_float(self.id_f_win, defaults[1])
-        k_loss = self._get_float(self.id_k_loss, defaults[2])
-        k_solar = self._get_float(self.id_k_solar, defaults[3])
-        alpha = self._get_float(self.id_thermal_alpha, 0.3)
-        self._attributes["factor_f_out"] = f_out
-        self._attributes["factor_f_win"] = f_win
-        self._attributes["factor_k_loss"] = k_loss
-        self._attributes["factor_k_solar"] = k_solar
-        self._attributes["thermal_alpha"] = alpha
+        # Read the five factor controls in one pass (IDs are all known here)
+        states_get = self.hass.states.get
+        state_float = self._state_float
+        f_out, f_win, k_loss, k_solar, alpha = [
+            state_float(states_get(entity_id), default)
+            for entity_id, default in zip(self._factor_ids, self._factor_defaults)
+        ]
+        attrs["factor_f_out"] = f_out
+        attrs["factor_f_win"] = f_win
+        attrs["factor_k_loss"] = k_loss
+        attrs["factor_k_solar"] = k_solar
+        attrs["thermal_alpha"] = alpha
 
         # --- Clouds/UV/Rain (Inputs) ---
-        cloud = self._get_attr(self.entity_weather, "cloud_coverage", None)
+        cloud = self._get_attr(weather_state, "cloud_coverage", None)
         cloud_source = "weather_entity"
         if cloud is None:
             cloud = 50.0
             cloud_source = "fallback"
-        self._attributes["cloud_coverage"] = cloud
-        self._attributes["cloud_source"] = cloud_source
+        attrs["cloud_coverage"] = cloud
+        attrs["cloud_source"] = cloud_source
         # --- UV Logic ---
         uv = None
         uv_source = "fallback"
@@ -3067,7 +2458,7 @@ class VirtualMRTSensor(SensorEntity):
 
         # 2. Try Weather Entity
         if uv is None:
-            uv = self._get_attr(self.entity_weather, "uv_index", None)
+            uv = self._get_attr(weather_state, "uv_index", None)
             if uv is not None:
                 uv_source = "weather_entity"
 
@@ -3075,8 +2466,8 @@ class VirtualMRTSensor(SensorEntity):
         if uv is None:
             uv = 0.0
 
-        self._attributes["uv_index"] = uv
-        self._attributes["uv_source"] = uv_source
+        attrs["uv_index"] = uv
+        attrs["uv_source"] = uv_source
 
         # --- RAIN LOGIC ---
         is_raining = False
@@ -3091,18 +2482,17 @@ class VirtualMRTSensor(SensorEntity):
 
         # 2. Try Weather Entity State (String match)
         if rain_source == "unknown":
-            weather_state_obj = self.hass.states.get(self.entity_weather)
-            cond = weather_state_obj.state.lower() if weather_state_obj else ""
-            is_raining = any(x in cond for x in ["rain", "pour", "snow", "hail"])
-            rain_source = "weather_entity_condition_string" if weather_state_obj else "fallback"
+            cond = weather_state.state.lower() if weather_state else ""
+            is_raining = any(x in cond for x in RAIN_CONDITION_KEYWORDS)
+            rain_source = "weather_entity_condition_string" if weather_state else "fallback"
 
         rain_mul = 0.4 if is_raining else 1.0
-        self._attributes["rain_multiplier"] = rain_mul
-        self._attributes["rain_source"] = rain_source
+        attrs["rain_multiplier"] = rain_mul
+        attrs["rain_source"] = rain_source
 
-        elevation = self._get_attr("sun.sun", "elevation", 0.0)
+        elevation = self._get_attr(sun_state, "elevation", 0.0)
         day_fac = max(0, min(1, (elevation + 6.0) / 66.0))
-        self._attributes["daylight_factor"] = round(day_fac, 3)
+        attrs["daylight_factor"] = round(day_fac, 3)
 
         # --- Radiation (Calc) ---
         rad_source = "heuristic"
@@ -3124,12 +2514,12 @@ class VirtualMRTSensor(SensorEntity):
             rad_val = min(1000, est)
             rad_source = "heuristic"
         rad_final = max(0.0, rad_val)
-        self._attributes["radiation"] = round(rad_final, 1)
-        self._attributes["radiation_source"] = rad_source
+        attrs["radiation"] = round(rad_final, 1)
+        attrs["radiation_source"] = rad_source
 
         # --- Shading Factor ---
         shading_factor = self._get_shading_factor()
-        self._attributes["shading_factor"] = round(shading_factor, 2)
+        attrs["shading_factor"] = round(shading_factor, 2)
 
         # --- CALCULATE RADIANT BOOST ---
         new_boost = 0.0
@@ -3163,11 +2553,11 @@ class VirtualMRTSensor(SensorEntity):
             )
             self._radiant_boost_stored = new_boost
 
-        self._attributes["radiant_boost_current"] = round(new_boost, 2)
+        attrs["radiant_boost_current"] = round(new_boost, 2)
 
         # --- Incidence Factor ---
-        incidence_factor = self._get_solar_incidence_factor()
-        self._attributes["solar_incidence_factor"] = round(incidence_factor, 2)
+        incidence_factor = self._get_solar_incidence_factor(sun_state)
+        attrs["solar_incidence_factor"] = round(incidence_factor, 2)
 
         # --- MRT Calculation ---
         term_loss = (
@@ -3181,9 +2571,9 @@ class VirtualMRTSensor(SensorEntity):
         )
         mrt_calc = t_air - term_loss + term_solar + new_boost
 
-        self._attributes["loss_term"] = round(term_loss, 3)
-        self._attributes["solar_term"] = round(term_solar, 3)
-        self._attributes["mrt_unclamped"] = round(mrt_calc, 2)
+        attrs["loss_term"] = round(term_loss, 3)
+        attrs["solar_term"] = round(term_solar, 3)
+        attrs["mrt_unclamped"] = round(mrt_calc, 2)
 
         # --- Estimated Wall Surface Temp ---
         # Theoretical inner surface temp of the exterior wall
@@ -3191,13 +2581,13 @@ class VirtualMRTSensor(SensorEntity):
         # We use t_out_eff to account for wind chill cooling the exterior
         if t_air is not None and t_out_eff is not None:
             t_wall_est = t_air - ((t_air - t_out_eff) * k_loss)
-            self._attributes["estimated_wall_surface_temp"] = round(t_wall_est, 1)
+            attrs["estimated_wall_surface_temp"] = round(t_wall_est, 1)
 
         # --- Clamping ---
         lower_dyn = max(t_out_eff + 2.0, t_air - 3.0)
         upper_dyn = t_air + 4.0
         mrt_clamped = max(lower_dyn, min(mrt_calc, upper_dyn))
-        self._attributes["mrt_clamped"] = round(mrt_clamped, 2)
+        attrs["mrt_clamped"] = round(mrt_clamped, 2)
 
         # --- Smoothing ---
         if self._mrt_prev is None:
@@ -3208,3 +2598,4 @@ class VirtualMRTSensor(SensorEntity):
 
         # --- Final Value ---
         self._attr_native_value = round(mrt_final, 2)
+        self._attributes = attrs
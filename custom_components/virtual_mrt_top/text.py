@@ -22,7 +22,7 @@ async def async_setup_entry(
     config = entry.data
     if config.get(CONF_DEVICE_TYPE) == TYPE_AGGREGATOR:
         return
-    device_info = await get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
+    device_info = get_device_info({(DOMAIN, entry.entry_id)}, config[CONF_NAME])
 
     async_add_entities([VirtualProfileText(hass, entry, device_info)])
 